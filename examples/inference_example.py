@@ -44,7 +44,11 @@ class UserData(BaseSchema):
 
 def load_annotated() -> None:
     """Load with explicit schema annotation — full static checking."""
-    df: Annotated[pd.DataFrame, UserData] = pd.read_csv("users.csv")
+    df: Annotated[pd.DataFrame, UserData] = pd.read_csv(
+        "users.csv",
+        usecols=["user_id", "email", "age"],
+        dtype={"user_id": int, "email": str, "age": int},
+    )
     print(df["user_id"])
     print(df["email"])
     # Accessing df["username"] would error: Column 'username' not in UserData
@@ -122,7 +126,11 @@ def load_without_columns() -> None:
 
 def method_chain_inference() -> None:
     """Demonstrate column set propagation through pandas method chains."""
-    df: Annotated[pd.DataFrame, UserData] = pd.read_csv("users.csv")
+    df: Annotated[pd.DataFrame, UserData] = pd.read_csv(
+        "users.csv",
+        usecols=["user_id", "email", "age"],
+        dtype={"user_id": int, "email": str, "age": int},
+    )
 
     # Subscript slice — inferred column set {user_id, email}
     small = df[["user_id", "email"]]
@@ -153,7 +161,7 @@ def method_chain_inference() -> None:
 
 def polars_select_inference() -> None:
     """Demonstrate select() inference for polars."""
-    df: Annotated[pl.DataFrame, UserData] = pl.read_csv("users.csv")
+    df: Annotated[pl.DataFrame, UserData] = pl.read_csv("users.csv", columns=["user_id", "email", "age"])
 
     # select() with a literal list — inferred column set {user_id, email}
     small = df.select(["user_id", "email"])
@@ -169,7 +177,11 @@ def polars_select_inference() -> None:
 
 def inference_gaps() -> None:
     """Show dropped-unknown-column: dropping a column not present in the inferred set."""
-    df: Annotated[pd.DataFrame, UserData] = pd.read_csv("users.csv")
+    df: Annotated[pd.DataFrame, UserData] = pd.read_csv(
+        "users.csv",
+        usecols=["user_id", "email", "age"],
+        dtype={"user_id": int, "email": str, "age": int},
+    )
 
     # Dropping a column that the checker knows doesn't exist — dropped-unknown-column warning:
     # dropped-unknown-column: Dropped column 'nonexistent' does not exist in UserData
@@ -7,10 +7,64 @@ use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use std::fs;
 use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::{Arc, Mutex, OnceLock, PoisonError};
+
+/// Which warning diagnostics `check_file` should return. Filtering happens before
+/// serialization so suppressed warnings never cross into Python.
+#[derive(Clone, Copy)]
+struct WarningFilter {
+    include_warnings: bool,
+    include_ingest_warnings: bool,
+}
+
+impl WarningFilter {
+    fn keeps(self, error: &LintError) -> bool {
+        if error.severity != "warning" {
+            return true;
+        }
+        self.include_warnings
+            && (self.include_ingest_warnings || error.code != CODE_UNTRACKED_DATAFRAME)
+    }
+}
+
+/// Check one file, returning its diagnostics as a JSON string.
+///
+/// `index_bytes` must be a `bytes` object, as returned by `build_project_index`.
+/// It is borrowed without copying while the GIL is released, so mutable buffers
+/// such as `bytearray` or `memoryview` are rejected with `TypeError`; pass
+/// `bytes(buffer)` instead.
 #[pyfunction]
-#[pyo3(signature = (file_path, index_bytes = None))]
-fn check_file(file_path: String, index_bytes: Option<Vec<u8>>) -> PyResult<String> {
-    let path = Path::new(&file_path);
+#[pyo3(signature = (
+    file_path,
+    index_bytes = None,
+    *,
+    include_warnings = true,
+    include_ingest_warnings = true
+))]
+fn check_file(
+    py: Python<'_>,
+    file_path: String,
+    index_bytes: Option<&[u8]>,
+    include_warnings: bool,
+    include_ingest_warnings: bool,
+) -> PyResult<String> {
+    let filter = WarningFilter {
+        include_warnings,
+        include_ingest_warnings,
+    };
+    // Checking never touches Python objects, so release the GIL and let callers
+    // check several files concurrently from a thread pool. `index_bytes` borrows
+    // the caller's immutable bytes object directly instead of copying it.
+    py.allow_threads(|| check_file_impl(&file_path, index_bytes, filter))
+}
+
+fn check_file_impl(
+    file_path: &str,
+    index_bytes: Option<&[u8]>,
+    filter: WarningFilter,
+) -> PyResult<String> {
+    let path = Path::new(file_path);
     let project_root = find_project_root(path);
     let config = load_linter_config(&project_root);
 
@@ -24,7 +78,7 @@ fn check_file(file_path: String, index_bytes: Option<Vec<u8>>) -> PyResult<Strin
     let mut linter = Linter::new();
 
     if let Some(bytes) = index_bytes {
-        if let Ok(index) = rmp_serde::from_slice::<ProjectIndex>(&bytes) {
+        if let Some(index) = load_index_cached(bytes) {
             linter.load_cross_file_symbols(&index, &source, path, &project_root);
         }
     }
@@ -33,18 +87,119 @@ fn check_file(file_path: String, index_bytes: Option<Vec<u8>>) -> PyResult<Strin
         .check_file_internal(&source, path)
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("{}", e)))?;
 
-    if !config.warnings.unwrap_or(true) {
-        errors.retain(|e| e.severity != "warning");
-    }
+    let filter = WarningFilter {
+        include_warnings: filter.include_warnings && config.warnings.unwrap_or(true),
+        ..filter
+    };
+    errors.retain(|e| filter.keeps(e));
 
     serde_json::to_string(&errors)
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("{}", e)))
 }
 
+/// Check several files in one call, returning each file's JSON diagnostics in input order.
+///
+/// The GIL is released once for the whole batch and files are spread across
+/// scoped worker threads, so callers make a single FFI crossing per run.
+/// `index_bytes` must be a `bytes` object, as for `check_file`.
 #[pyfunction]
-fn build_project_index(project_root: String) -> PyResult<Vec<u8>> {
-    let root = Path::new(&project_root);
-    let index = build_index_internal(root);
+#[pyo3(signature = (
+    file_paths,
+    index_bytes = None,
+    *,
+    include_warnings = true,
+    include_ingest_warnings = true
+))]
+fn check_files(
+    py: Python<'_>,
+    file_paths: Vec<String>,
+    index_bytes: Option<&[u8]>,
+    include_warnings: bool,
+    include_ingest_warnings: bool,
+) -> PyResult<Vec<String>> {
+    let filter = WarningFilter {
+        include_warnings,
+        include_ingest_warnings,
+    };
+    // Every file is checked before any error is raised, and the error reported is
+    // the one for the earliest failing path, whichever thread finished first.
+    py.allow_threads(|| check_files_impl(&file_paths, index_bytes, filter))
+        .into_iter()
+        .collect()
+}
+
+/// Check each file, returning one result per input path in input order. A file
+/// that cannot be read or parsed yields an error in its own slot while the rest
+/// of the batch is still checked.
+fn check_files_impl(
+    file_paths: &[String],
+    index_bytes: Option<&[u8]>,
+    filter: WarningFilter,
+) -> Vec<PyResult<String>> {
+    let workers = std::thread::available_parallelism()
+        .map_or(1, |n| n.get())
+        .min(file_paths.len());
+    if workers <= 1 {
+        return file_paths
+            .iter()
+            .map(|path| check_file_impl(path, index_bytes, filter))
+            .collect();
+    }
+
+    // Workers pull the next unchecked file from a shared counter so one slow
+    // file does not leave the other threads idle.
+    let next = AtomicUsize::new(0);
+    let checked: Vec<(usize, PyResult<String>)> = std::thread::scope(|scope| {
+        let handles: Vec<_> = (0..workers)
+            .map(|_| {
+                let next = &next;
+                scope.spawn(move || {
+                    let mut out = Vec::new();
+                    loop {
+                        let i = next.fetch_add(1, Ordering::Relaxed);
+                        let Some(path) = file_paths.get(i) else {
+                            break;
+                        };
+                        out.push((i, check_file_impl(path, index_bytes, filter)));
+                    }
+                    out
+                })
+            })
+            .collect();
+        handles
+            .into_iter()
+            .flat_map(|handle| handle.join().unwrap_or_default())
+            .collect()
+    });
+
+    let mut results: Vec<Option<PyResult<String>>> = file_paths.iter().map(|_| None).collect();
+    for (i, result) in checked {
+        results[i] = Some(result);
+    }
+    results
+        .into_iter()
+        .map(|result| {
+            result.unwrap_or_else(|| {
+                Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+                    "checker thread panicked",
+                ))
+            })
+        })
+        .collect()
+}
+
+/// Build the MessagePack project index for `project_root`.
+///
+/// When `file_paths` is given, exactly those files are indexed instead of walking
+/// `project_root`, so a caller that keys a cached index on its own file list
+/// always gets an index covering that same list.
+#[pyfunction]
+#[pyo3(signature = (project_root, file_paths = None))]
+fn build_project_index(project_root: String, file_paths: Option<Vec<String>>) -> PyResult<Vec<u8>> {
+    let index = match file_paths {
+        Some(paths) => index_files(paths.into_iter().map(PathBuf::from)),
+        None => build_index_internal(Path::new(&project_root)),
+    };
     rmp_serde::to_vec(&index)
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("{}", e)))
 }
@@ -52,6 +207,7 @@ fn build_project_index(project_root: String) -> PyResult<Vec<u8>> {
 #[pymodule]
 fn _rust_checker(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(check_file, m)?)?;
+    m.add_function(wrap_pyfunction!(check_files, m)?)?;
     m.add_function(wrap_pyfunction!(build_project_index, m)?)?;
     Ok(())
 }
@@ -152,6 +308,37 @@ struct ProjectIndex {
 
 // ── Index helpers ──────────────────────────────────────────────────────────────
 
+/// The most recently deserialized project index together with the MessagePack bytes
+/// it was read from. A `typedframes check` run passes the same bytes for every file,
+/// so the index is deserialized once per process instead of once per file.
+static INDEX_CACHE: OnceLock<Mutex<Option<CachedIndex>>> = OnceLock::new();
+
+type CachedIndex = (Arc<[u8]>, Arc<ProjectIndex>);
+
+fn load_index_cached(bytes: &[u8]) -> Option<Arc<ProjectIndex>> {
+    // Holding the lock while deserializing makes concurrent callers wait for the
+    // first parse rather than each parsing the same bytes. The cache only ever
+    // holds a complete entry, so a panic in another holder leaves it usable.
+    let mut cached = INDEX_CACHE
+        .get_or_init(|| Mutex::new(None))
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner);
+    // Comparing the bytes themselves (length first, then contents) means two
+    // different indexes can never be mistaken for each other.
+    if let Some((cached_bytes, index)) = cached.as_ref() {
+        if **cached_bytes == *bytes {
+            return Some(Arc::clone(index));
+        }
+    }
+    let index = Arc::new(rmp_serde::from_slice::<ProjectIndex>(bytes).ok()?);
+    *cached = Some((Arc::from(bytes), Arc::clone(&index)));
+    Some(index)
+}
+
+/// Non-hidden directories that never hold project sources. Kept in sync with
+/// `_IGNORED_DIRS` in the Python CLI's file walker.
+const IGNORED_DIRS: [&str; 3] = ["__pycache__", "node_modules", "venv"];
+
 fn collect_py_files(dir: &Path) -> Vec<PathBuf> {
     let mut result = Vec::new();
     let mut stack = vec![dir.to_path_buf()];
@@ -166,9 +353,16 @@ fn collect_py_files(dir: &Path) -> Vec<PathBuf> {
             if name_str.starts_with('.') {
                 continue;
             }
-            if path.is_dir() {
-                stack.push(path);
-            } else if path.extension().and_then(|e| e.to_str()) == Some("py") {
+            let Ok(file_type) = entry.file_type() else {
+                continue;
+            };
+            // As in the Python walker, symlinked directories are not descended
+            // into, while symlinks to .py files are followed and kept.
+            if file_type.is_dir() {
+                if !IGNORED_DIRS.contains(&name_str.as_ref()) {
+                    stack.push(path);
+                }
+            } else if path.extension().and_then(|e| e.to_str()) == Some("py") && path.is_file() {
                 result.push(path);
             }
         }
@@ -235,7 +429,10 @@ fn index_file(path: &Path) -> Option<IndexEntry> {
 }
 
 fn build_index_internal(project_root: &Path) -> ProjectIndex {
-    let py_files = collect_py_files(project_root);
+    index_files(collect_py_files(project_root))
+}
+
+fn index_files(py_files: impl IntoIterator<Item = PathBuf>) -> ProjectIndex {
     let mut files = HashMap::new();
     for file_path in py_files {
         if let Some(entry) = index_file(&file_path) {
@@ -2424,6 +2621,249 @@ print(df["emai"])
         assert!(is_enabled(root));
     }
 
+    fn write_check_files_fixture(root: &Path, name: &str, column: &str) -> String {
+        let source = format!(
+            "from typedframes import BaseSchema, Column\n\n\
+             class UserSchema(BaseSchema):\n    user_id = Column(type=int)\n\n\
+             df: DataFrame[UserSchema] = load()\nprint(df[\"{column}\"])\n"
+        );
+        let path = root.join(name);
+        fs::write(&path, source).unwrap();
+        path.to_string_lossy().into_owned()
+    }
+
+    const KEEP_ALL: WarningFilter = WarningFilter {
+        include_warnings: true,
+        include_ingest_warnings: true,
+    };
+
+    #[test]
+    fn test_should_return_check_files_results_in_input_order() {
+        // arrange
+        let temp = tempfile::tempdir().unwrap();
+        fs::write(temp.path().join("pyproject.toml"), "").unwrap();
+        let paths: Vec<String> = ["alpha", "user_id", "gamma", "delta"]
+            .iter()
+            .enumerate()
+            .map(|(i, column)| write_check_files_fixture(temp.path(), &format!("f{i}.py"), column))
+            .collect();
+
+        // act
+        let results = check_files_impl(&paths, None, KEEP_ALL);
+
+        // assert
+        let outputs: Vec<String> = results.into_iter().map(|r| r.unwrap()).collect();
+        assert_eq!(outputs.len(), 4);
+        assert!(outputs[0].contains("alpha"));
+        assert_eq!(outputs[1], "[]");
+        assert!(outputs[2].contains("gamma"));
+        assert!(outputs[3].contains("delta"));
+    }
+
+    #[test]
+    fn test_should_return_no_check_files_results_for_empty_input() {
+        // act
+        let results = check_files_impl(&[], None, KEEP_ALL);
+
+        // assert
+        assert!(results.is_empty());
+    }
+
+    #[test]
+    fn test_should_report_unreadable_path_without_aborting_check_files_batch() {
+        // arrange
+        let temp = tempfile::tempdir().unwrap();
+        fs::write(temp.path().join("pyproject.toml"), "").unwrap();
+        let paths = vec![
+            write_check_files_fixture(temp.path(), "first.py", "alpha"),
+            temp.path()
+                .join("missing.py")
+                .to_string_lossy()
+                .into_owned(),
+            write_check_files_fixture(temp.path(), "last.py", "gamma"),
+        ];
+
+        // act
+        let results = check_files_impl(&paths, None, KEEP_ALL);
+
+        // assert
+        assert_eq!(results.len(), 3);
+        assert!(results[0].as_ref().unwrap().contains("alpha"));
+        assert!(results[1].is_err());
+        assert!(results[2].as_ref().unwrap().contains("gamma"));
+    }
+
+    /// Serializes tests that touch the process-wide `INDEX_CACHE`.
+    static INDEX_CACHE_TEST_LOCK: Mutex<()> = Mutex::new(());
+
+    fn index_bytes(version: u32) -> Vec<u8> {
+        let index = ProjectIndex {
+            version,
+            files: HashMap::new(),
+        };
+        rmp_serde::to_vec(&index).unwrap()
+    }
+
+    #[test]
+    fn test_should_reuse_cached_index_only_for_identical_bytes() {
+        // arrange
+        let _serial = INDEX_CACHE_TEST_LOCK
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner);
+        let first_bytes = index_bytes(1);
+        let other_bytes = index_bytes(2);
+        assert_eq!(first_bytes.len(), other_bytes.len());
+        let first = load_index_cached(&first_bytes).unwrap();
+
+        // act
+        let same = load_index_cached(&index_bytes(1)).unwrap();
+        let other = load_index_cached(&other_bytes).unwrap();
+
+        // assert
+        assert!(Arc::ptr_eq(&first, &same));
+        assert!(!Arc::ptr_eq(&first, &other));
+        assert_eq!(other.version, 2);
+    }
+
+    #[test]
+    fn test_should_load_index_after_cache_lock_is_poisoned() {
+        // arrange
+        let _serial = INDEX_CACHE_TEST_LOCK
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner);
+        let _ = std::thread::spawn(|| {
+            let _guard = INDEX_CACHE.get_or_init(|| Mutex::new(None)).lock();
+            panic!("poison the index cache lock");
+        })
+        .join();
+
+        // act
+        let index = load_index_cached(&index_bytes(3));
+
+        // assert
+        assert_eq!(index.map(|index| index.version), Some(3));
+    }
+
+    fn diagnostic(code: &str, severity: &str) -> LintError {
+        LintError {
+            line: 1,
+            col: 1,
+            code: code.to_string(),
+            message: String::new(),
+            severity: severity.to_string(),
+        }
+    }
+
+    #[test]
+    fn test_should_apply_warning_filter_for_each_flag_combination() {
+        // arrange
+        let error = diagnostic(CODE_UNKNOWN_COLUMN, "error");
+        let warning = diagnostic(CODE_RESERVED_NAME, "warning");
+        let untracked = diagnostic(CODE_UNTRACKED_DATAFRAME, "warning");
+        // (include_warnings, include_ingest_warnings) -> keeps (error, warning, untracked)
+        let cases = [
+            ((true, true), (true, true, true)),
+            ((true, false), (true, true, false)),
+            ((false, true), (true, false, false)),
+            ((false, false), (true, false, false)),
+        ];
+
+        for ((include_warnings, include_ingest_warnings), expected) in cases {
+            let filter = WarningFilter {
+                include_warnings,
+                include_ingest_warnings,
+            };
+
+            // act
+            let kept = (
+                filter.keeps(&error),
+                filter.keeps(&warning),
+                filter.keeps(&untracked),
+            );
+
+            // assert
+            assert_eq!(
+                kept, expected,
+                "include_warnings={include_warnings}, include_ingest_warnings={include_ingest_warnings}"
+            );
+        }
+    }
+
+    #[test]
+    fn test_should_keep_untracked_dataframe_error_regardless_of_warning_filter() {
+        // arrange
+        let error = diagnostic(CODE_UNTRACKED_DATAFRAME, "error");
+        let filter = WarningFilter {
+            include_warnings: false,
+            include_ingest_warnings: false,
+        };
+
+        // act
+        let kept = filter.keeps(&error);
+
+        // assert
+        assert!(kept);
+    }
+
+    #[test]
+    fn test_should_prune_hidden_and_ignored_dirs_when_collecting_py_files() {
+        // arrange
+        let temp = tempfile::tempdir().unwrap();
+        let root = temp.path();
+        for dir in ["pkg", ".git", "__pycache__", "node_modules", "venv"] {
+            fs::create_dir_all(root.join(dir)).unwrap();
+            fs::write(root.join(dir).join("mod.py"), "").unwrap();
+        }
+        fs::write(root.join("main.py"), "").unwrap();
+        fs::write(root.join("notes.txt"), "").unwrap();
+
+        // act
+        let mut files = collect_py_files(root);
+        files.sort();
+
+        // assert
+        assert_eq!(files, vec![root.join("main.py"), root.join("pkg/mod.py")]);
+    }
+
+    #[cfg(unix)]
+    #[test]
+    fn test_should_not_follow_symlinked_dirs_when_collecting_py_files() {
+        // arrange
+        let temp = tempfile::tempdir().unwrap();
+        let outside = tempfile::tempdir().unwrap();
+        let root = temp.path();
+        fs::write(outside.path().join("linked_mod.py"), "").unwrap();
+        fs::write(outside.path().join("linked_file.py"), "").unwrap();
+        std::os::unix::fs::symlink(outside.path(), root.join("linked_dir")).unwrap();
+        std::os::unix::fs::symlink(outside.path().join("linked_file.py"), root.join("main.py"))
+            .unwrap();
+
+        // act
+        let files = collect_py_files(root);
+
+        // assert
+        assert_eq!(files, vec![root.join("main.py")]);
+    }
+
+    #[test]
+    fn test_should_index_only_the_given_files() {
+        // arrange
+        let temp = tempfile::tempdir().unwrap();
+        let root = temp.path();
+        let schema = "from typedframes import BaseSchema, Column\n\n\
+                      class UserSchema(BaseSchema):\n    user_id = Column(type=int)\n";
+        fs::write(root.join("listed.py"), schema).unwrap();
+        fs::write(root.join("unlisted.py"), schema).unwrap();
+        let listed = root.join("listed.py");
+
+        // act
+        let index = index_files([listed.clone()]);
+
+        // assert
+        let indexed: Vec<&String> = index.files.keys().collect();
+        assert_eq!(indexed, vec![&listed.to_string_lossy().into_owned()]);
+    }
+
     #[test]
     fn test_levenshtein() {
         assert_eq!(levenshtein("kitten", "sitting"), 3);
@@ -0,0 +1,37 @@
+"""Shared reading of ``[tool.typedframes]`` settings for the CLI and the mypy plugin."""
+
+from __future__ import annotations
+
+import tomllib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def index_enabled(start: Path) -> bool:
+    """Return False if the nearest ``pyproject.toml`` sets ``[tool.typedframes] build_index = false``.
+
+    The nearest ``pyproject.toml`` is the first one found in ``start`` or its parents, the same file the Rust
+    checker reads its settings from. A missing, unreadable or malformed file, or a ``tool``/``tool.typedframes``
+    value that is not a table, leaves the index enabled.
+
+    Args:
+        start: Directory to start the upward search from.
+
+    Returns:
+        Whether the cross-file project index should be built.
+
+    """
+    for parent in [start, *start.parents]:
+        config_path = parent / "pyproject.toml"
+        if config_path.is_file():
+            try:
+                with config_path.open("rb") as f:
+                    config = tomllib.load(f)
+            except (OSError, tomllib.TOMLDecodeError):
+                return True
+            tool = config.get("tool")
+            settings = tool.get("typedframes") if isinstance(tool, dict) else None
+            return not isinstance(settings, dict) or bool(settings.get("build_index", True))
+    return True
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import re
 from collections import defaultdict
 from typing import TYPE_CHECKING, ClassVar
 
@@ -13,9 +12,20 @@ from .column_set import ColumnSet
 
 if TYPE_CHECKING:
     import pandas as pd
+    import pandera as pa
     import polars as pl
 
 
+# (column_type_map, column_consumed_map) as returned by BaseSchema.compute_column_map
+ColumnMapResult = tuple[dict[str, type], dict[str, list[str]]]
+
+# (dataframe columns, greedy, (members, regex) per ColumnSet) identifying a cached compute_column_map result
+ColumnMapKey = tuple[tuple[str, ...], bool, tuple[tuple[tuple[str, ...], bool], ...]]
+
+# Distinct column layouts remembered per schema class before the compute_column_map cache is reset
+_COLUMN_MAP_CACHE_SIZE = 128
+
+
 class SchemaMeta(type):
     """Metaclass for BaseSchema that enables class-level + operator and MI conflict detection."""
 
@@ -91,6 +101,9 @@ class BaseSchema(metaclass=SchemaMeta):
     _column_map: ClassVar[dict[str, Column] | None] = None
     _column_set_map: ClassVar[dict[str, ColumnSet] | None] = None
     _column_group_map: ClassVar[dict[str, ColumnGroup] | None] = None
+    _key_column_map: ClassVar[dict[str, Column] | None] = None
+    _pandera_schema: ClassVar[pa.DataFrameSchema | None] = None  # set by typedframes.pandera.to_pandera_schema
+    _column_map_cache: ClassVar[dict[ColumnMapKey, ColumnMapResult] | None] = None
 
     enforce_columns: ClassVar[bool] = True
     enforce_types: ClassVar[bool] = True
@@ -124,18 +137,17 @@ class BaseSchema(metaclass=SchemaMeta):
         names: list[str] = [col.column_name for col in cls.columns().values()]
 
         for cs in cls.column_sets().values():
-            if not cs.regex and isinstance(cs.members, list):
+            if not cs.regex:
                 names.extend(cs.members)
 
         return names
 
     @classmethod
     def _build_key_column_map(cls) -> dict[str, Column]:
-        """Build mapping of column keys to Column objects."""
-        key_column_map: dict[str, Column] = {}
-        for col in cls.columns().values():
-            key_column_map[col.column_name] = col
-        return key_column_map
+        """Return mapping of column keys to Column objects, built once per schema class."""
+        if "_key_column_map" not in cls.__dict__ or cls._key_column_map is None:
+            cls._key_column_map = {col.column_name: col for col in cls.columns().values()}
+        return cls._key_column_map
 
     @classmethod
     def _match_column_to_set(
@@ -148,7 +160,7 @@ class BaseSchema(metaclass=SchemaMeta):
         current_match: Column | ColumnSet | None,
     ) -> bool:
         """Check if column matches a ColumnSet. Returns True if matched."""
-        matches = any(re.match(pattern, col_name) for pattern in cs.members) if cs.regex else col_name in cs.members
+        matches = any(pattern.match(col_name) for pattern in cs.compiled()) if cs.regex else col_name in cs.members
 
         if matches and consumed and not greedy:
             raise ColumnGroupError(col_name, current_match, cs)
@@ -165,6 +177,11 @@ class BaseSchema(metaclass=SchemaMeta):
         """
         Compute column type map and ColumnSet consumption from actual DataFrame columns.
 
+        Results are cached per schema class and column layout. Editing a ColumnSet's ``members`` or ``regex``
+        in place is picked up, but other changes to the schema after the first lookup (Column aliases or
+        types, ColumnSet types, adding or removing definitions) are not, so treat schema classes as immutable
+        once they are in use.
+
         Args:
             dataframe_columns: List of column names from the DataFrame.
             greedy: Override greedy_column_sets setting.
@@ -179,6 +196,27 @@ class BaseSchema(metaclass=SchemaMeta):
 
         """
         greedy = greedy if greedy is not None else cls.greedy_column_sets
+
+        # Frames read from the same source share a column layout, so cache the (regex) matching per layout and
+        # hand out copies so callers can't mutate the cached maps. Like ColumnSet.compiled(), the key tracks each
+        # ColumnSet's members and regex flag; everything else comes from the per-class columns()/column_sets()
+        # caches, which already assume the schema is not changed after first use.
+        set_state = tuple((tuple(cs.members), cs.regex) for cs in cls.column_sets().values())
+        key = (tuple(dataframe_columns), greedy, set_state)
+        if "_column_map_cache" not in cls.__dict__ or cls._column_map_cache is None:
+            cls._column_map_cache = {}
+        cached = cls._column_map_cache.get(key)
+        if cached is None:
+            cached = cls._match_columns(dataframe_columns, greedy=greedy)
+            if len(cls._column_map_cache) >= _COLUMN_MAP_CACHE_SIZE:
+                cls._column_map_cache.clear()
+            cls._column_map_cache[key] = cached
+        type_map, consumed_map = cached
+        return dict(type_map), {name: list(columns) for name, columns in consumed_map.items()}
+
+    @classmethod
+    def _match_columns(cls, dataframe_columns: list[str], *, greedy: bool) -> ColumnMapResult:
+        """Match DataFrame columns to Columns and ColumnSets; the uncached body of ``compute_column_map``."""
         column_consumed_map: dict[str, list[str]] = defaultdict(list)
         key_column_map = cls._build_key_column_map()
 
@@ -220,15 +258,12 @@ class BaseSchema(metaclass=SchemaMeta):
         ]
 
         if not cls.allow_extra_columns:
-            for col_name in df_columns:
-                if col_name not in defined:
-                    is_matched = False
-                    for cs in cls.column_sets().values():
-                        if cs.regex and isinstance(cs.members, list) and any(re.match(p, col_name) for p in cs.members):
-                            is_matched = True
-                            break
-                    if not is_matched:
-                        errors.append(f"Unexpected column: {col_name}")
+            regex_patterns = [pattern for cs in cls.column_sets().values() if cs.regex for pattern in cs.compiled()]
+            errors.extend(
+                f"Unexpected column: {col_name}"
+                for col_name in df_columns
+                if col_name not in defined and not any(p.match(col_name) for p in regex_patterns)
+            )
 
         return errors
 
@@ -3,10 +3,42 @@
 from __future__ import annotations
 
 import argparse
-import json
+import importlib
+import os
+import stat
 import sys
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from types import ModuleType
+
+from . import __version__
+from ._config import index_enabled
+
+
+def _import_orjson() -> ModuleType | None:
+    """Return the optional orjson module (``typedframes[orjson]``), or None when it is not installed."""
+    try:
+        return importlib.import_module("orjson")
+    except ImportError:
+        return None
+
+
+orjson = _import_orjson()
+
+# Per-directory cache of checker results for unchanged files (enabled with --cache)
+_CACHE_DIR = ".typedframes_cache"
+_CACHE_FILE = "v2.json"
+# Result sets kept per cache file, one per cache key, so alternating runs (e.g. one file, then its whole
+# directory) do not evict each other
+_CACHE_MAX_KEYS = 4
+_INDEX_FILE = "index.bin"
+
+# Non-hidden directories that never hold project sources; kept in sync with IGNORED_DIRS in the Rust index builder
+_IGNORED_DIRS = frozenset({"__pycache__", "node_modules", "venv"})
 
 # ANSI escape sequences
 _RESET = "\033[0m"
@@ -15,20 +47,232 @@ _BOLD_RED = "\033[1;31m"
 _BOLD_GREEN = "\033[1;32m"
 _BOLD_YELLOW = "\033[1;33m"
 
+# Colored severity labels, built once rather than per formatted error
+_COLOR_ERROR_LABEL = f"{_BOLD_RED}error{_RESET}"
+_COLOR_WARNING_LABEL = f"{_BOLD_YELLOW}warning{_RESET}"
+
 
-def _collect_python_files(path: Path) -> list[Path]:
-    """Collect all .py files from a path (file or directory)."""
-    if path.is_file():
-        if path.suffix == ".py":
+def _iter_python_files(root: str) -> Iterator[str]:
+    """Yield paths of all .py files under ``root``, skipping hidden entries and ``_IGNORED_DIRS``.
+
+    Walks with ``os.scandir`` and an explicit stack so directory entries reuse the stat data returned by the
+    listing. The skip rules match the Rust project-index builder. Directories that cannot be listed (for
+    example, permission denied) are skipped, as ``Path.rglob`` does.
+    """
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in _IGNORED_DIRS:
+                        stack.append(entry.path)
+                elif name.endswith(".py") and entry.is_file():
+                    yield entry.path
+
+
+def _collect_python_files(path: Path, *, is_dir: bool | None = None) -> list[Path]:
+    """Collect all .py files from a path (file or directory).
+
+    Args:
+        path: File or directory to collect from.
+        is_dir: Whether ``path`` is a directory, when the caller has already stat-ed it. Checked if omitted.
+    """
+    if is_dir is None:
+        is_dir = path.is_dir()
+    if not is_dir:
+        if path.name.endswith(".py"):
             return [path]
         return []
-    return sorted(path.rglob("*.py"))
+    # Sort the plain strings before wrapping them: str comparison is much cheaper than Path.__lt__
+    return [Path(p) for p in sorted(_iter_python_files(str(path)))]
+
+
+def _loads(data: str) -> list[dict]:
+    """Decode checker JSON output, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+
+    return json.loads(data)
+
+
+def _dumps(data: list[dict], *, indent: bool = True) -> str:
+    """Encode errors as JSON, indented by default, using orjson when it is installed.
+
+    The stdlib fallback uses orjson's separators and leaves non-ASCII characters unescaped, so the output is the
+    same whichever encoder runs.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    import json
+
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def _write_json(data: list[dict], *, indent: bool) -> None:
+    """Write errors to stdout as JSON followed by a newline.
+
+    When ``sys.stdout`` has a binary stream underneath, the UTF-8 bytes are written to it directly: orjson's
+    output as-is, skipping the decode to ``str`` and the text layer's re-encode, or the stdlib fallback encoded
+    once. Either way the bytes do not depend on the terminal's encoding or on whether orjson is installed.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(_dumps(data, indent=indent) + "\n")
+        return
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=(orjson.OPT_INDENT_2 if indent else 0) | orjson.OPT_APPEND_NEWLINE)
+    else:
+        encoded = (_dumps(data, indent=indent) + "\n").encode()
+    sys.stdout.flush()
+    buffer.write(encoded)
+
+
+def _nearest_pyprojects(files: list[Path]) -> list[Path]:
+    """Return the distinct ``pyproject.toml`` files that ``files`` resolve to, in sorted order.
+
+    Each file resolves to the nearest ``pyproject.toml`` at or above its directory, as the checker does when it
+    reads its settings. Lookups are memoized per directory so files sharing a package walk up only once.
+    """
+    nearest: dict[Path, Path | None] = {}
+    for directory in {file_path.parent for file_path in files}:
+        visited = []
+        current = directory
+        while current not in nearest:
+            visited.append(current)
+            config_path = current / "pyproject.toml"
+            if config_path.is_file():
+                found = config_path
+                break
+            if current.parent == current:
+                found = None
+                break
+            current = current.parent
+        else:
+            found = nearest[current]
+        for visited_dir in visited:
+            nearest[visited_dir] = found
+    return sorted({config_path for config_path in nearest.values() if config_path is not None})
+
+
+def _cache_key(
+    files: list[Path],
+    index_bytes: bytes | None,
+    *,
+    include_warnings: bool = True,
+    include_ingest_warnings: bool = True,
+) -> str:
+    """Return a digest of everything besides file contents that affects checker results.
+
+    Covers the typedframes version, the project index, the warning filters and every ``pyproject.toml`` the
+    checked files resolve to (which the checker reads for its ``enabled`` and ``warnings`` settings).
+    """
+    import hashlib
+
+    digest = hashlib.blake2b(__version__.encode(), digest_size=16)
+    digest.update(index_bytes or b"")
+    digest.update(bytes([include_warnings, include_ingest_warnings]))
+    for config_path in _nearest_pyprojects(files):
+        digest.update(f"{config_path}\0".encode())
+        digest.update(config_path.read_bytes())
+    return digest.hexdigest()
+
+
+def _read_cache_results(cache_path: Path) -> dict[str, dict[str, list]]:
+    """Read the per-key result sets from a cache file, returning an empty mapping if missing or unreadable."""
+    import json
+
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    results = data.get("results") if isinstance(data, dict) else None
+    return results if isinstance(results, dict) else {}
+
+
+def _load_cache(cache_path: Path, key: str) -> dict[str, list]:
+    """Load cached per-file results for ``key``, returning an empty cache if missing, unreadable or stale."""
+    entries = _read_cache_results(cache_path).get(key)
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_cache_file(cache_path: Path, data: bytes) -> None:
+    """Atomically write a file into the cache directory, ignoring filesystem errors."""
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        (cache_path.parent / ".gitignore").write_text("*\n", encoding="utf-8")
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+
+
+def _save_cache(cache_path: Path, key: str, entries: dict[str, list]) -> None:
+    """Atomically write per-file results for ``key`` to the cache, ignoring filesystem errors.
+
+    Result sets stored under other keys are kept, up to the ``_CACHE_MAX_KEYS`` most recently saved.
+    """
+    import json
+
+    results = _read_cache_results(cache_path)
+    results.pop(key, None)
+    results[key] = entries
+    recent = dict(list(results.items())[-_CACHE_MAX_KEYS:])
+    _write_cache_file(cache_path, json.dumps({"results": recent}).encode())
+
+
+def _build_index(root: Path, files: list[Path], cache_dir: Path | None = None) -> bytes | None:
+    """Build the project index for ``root``, or return None if the Rust extension is not installed.
+
+    Args:
+        root: Project directory to index.
+        files: The Python files under ``root``. Exactly these files are indexed, and their paths, sizes and
+            modification times key the cached index, so the key always describes the indexed file set.
+        cache_dir: Directory holding a previously built index. When given, the index is rebuilt only if a file
+            was added, removed or modified since it was written.
+    """
+    try:
+        from typedframes._rust_checker import build_project_index  # ty: ignore[unresolved-import]
+    except ImportError:
+        return None
+    file_paths = [str(file_path) for file_path in files]
+    if cache_dir is None:
+        return build_project_index(str(root), file_paths)
+
+    import hashlib
 
+    digest = hashlib.blake2b(__version__.encode(), digest_size=16)
+    for file_path in files:
+        file_stat = file_path.stat()
+        digest.update(f"{file_path}\0{file_stat.st_mtime_ns}\0{file_stat.st_size}\n".encode())
+    key = digest.hexdigest().encode()
 
-def _check_files(files: list[Path], *, index_bytes: bytes | None = None) -> list[dict]:
-    """Run the Rust checker on each file, returning all errors with file paths."""
+    index_path = cache_dir / _INDEX_FILE
     try:
-        from typedframes._rust_checker import check_file  # ty: ignore[unresolved-import]
+        cached_key, _, cached_index = index_path.read_bytes().partition(b"\n")
+    except OSError:
+        cached_key, cached_index = b"", b""
+    if cached_key == key:
+        return cached_index
+    index_bytes = build_project_index(str(root), file_paths)
+    _write_cache_file(index_path, key + b"\n" + index_bytes)
+    return index_bytes
+
+
+def _load_check_files() -> Callable[..., list[str]]:
+    """Import the extension's ``check_files``, exiting with a hint if the Rust checker is not installed."""
+    try:
+        from typedframes._rust_checker import check_files  # ty: ignore[unresolved-import]
     except ImportError:
         msg = (
             "The Rust checker extension was not found. "
@@ -36,48 +280,109 @@ def _check_files(files: list[Path], *, index_bytes: bytes | None = None) -> list
         )
         print(msg, file=sys.stderr)
         sys.exit(1)
+    return check_files
+
+
+def _check_files(
+    files: list[Path],
+    *,
+    index_bytes: bytes | None = None,
+    cache: dict[str, list] | None = None,
+    include_warnings: bool = True,
+    include_ingest_warnings: bool = True,
+) -> list[dict]:
+    """Run the Rust checker on each file, returning all errors with file paths.
+
+    Files that need checking are handed to the extension in a single ``check_files`` call, which releases the GIL
+    once and checks them in parallel on Rust threads sharing ``index_bytes``. Results keep the order of ``files``.
+    The extension is only imported when there is something to check, so an empty file list or a run served
+    entirely from ``cache`` never loads it.
+
+    Args:
+        files: Python files to check.
+        index_bytes: Serialized project index for cross-file resolution.
+        cache: Optional mapping of file path to ``[mtime_ns, size, errors]``. Files whose modification time and
+            size match their entry reuse the cached errors; all other entries are refreshed in place.
+        include_warnings: Return warning diagnostics. When False, the checker drops all warnings.
+        include_ingest_warnings: Return ``untracked-dataframe`` warnings for bare DataFrame loads.
+
+    """
+    results: list[list[dict] | None] = [None] * len(files)
+    stats: dict[int, os.stat_result] = {}
+    pending: list[int] = []
+    for i, file_path in enumerate(files):
+        if cache is not None:
+            file_stat = file_path.stat()
+            entry = cache.get(str(file_path))
+            if entry is not None and entry[:2] == [file_stat.st_mtime_ns, file_stat.st_size]:
+                results[i] = entry[2]
+                continue
+            stats[i] = file_stat
+        pending.append(i)
+
+    if pending:
+        check_files = _load_check_files()
+        outputs = check_files(
+            [str(files[i]) for i in pending],
+            index_bytes,
+            include_warnings=include_warnings,
+            include_ingest_warnings=include_ingest_warnings,
+        )
+        for i, result_json in zip(pending, outputs, strict=True):
+            errors = [] if result_json == "[]" else _loads(result_json)
+            for error in errors:
+                error["file"] = str(files[i])
+            results[i] = errors
+            if i in stats:
+                cache[str(files[i])] = [stats[i].st_mtime_ns, stats[i].st_size, errors]
 
     all_errors = []
-    for file_path in files:
-        result_json = check_file(str(file_path), index_bytes)
-        errors = json.loads(result_json)
-        for error in errors:
-            error["file"] = str(file_path)
+    for errors in results:
         all_errors.extend(errors)
     return all_errors
 
 
-def _format_text(errors: list[dict], *, color: bool = False) -> str:
-    """Format errors as text lines using ty-style file:line:col: severity[code] message."""
+def _format_text_plain(errors: list[dict]) -> str:
+    """Format errors as uncolored text lines."""
     lines = []
     for error in errors:
+        code = error.get("code")
+        code_part = f"[{code}]" if code else ""
         severity = error.get("severity", "error")
-        code = error.get("code", "")
-        file_ = error["file"]
-        line = error["line"]
-        col = error["col"]
-        message = error["message"]
+        lines.append(f"{error['file']}:{error['line']}:{error['col']}: {severity}{code_part} {error['message']}")
+    return "\n".join(lines)
+
+
+def _format_text_color(errors: list[dict]) -> str:
+    """Format errors as text lines with a bold file path and colored severity label."""
+    lines = []
+    for error in errors:
+        code = error.get("code")
         code_part = f"[{code}]" if code else ""
-        if color:
-            sev_colored = f"{_BOLD_RED}error{_RESET}" if severity == "error" else f"{_BOLD_YELLOW}warning{_RESET}"
-            lines.append(f"{_BOLD}{file_}{_RESET}:{line}:{col}: {sev_colored}{code_part} {message}")
-        else:
-            lines.append(f"{file_}:{line}:{col}: {severity}{code_part} {message}")
+        severity = _COLOR_ERROR_LABEL if error.get("severity", "error") == "error" else _COLOR_WARNING_LABEL
+        lines.append(
+            f"{_BOLD}{error['file']}{_RESET}:{error['line']}:{error['col']}: {severity}{code_part} {error['message']}"
+        )
     return "\n".join(lines)
 
 
+def _format_text(errors: list[dict], *, color: bool = False) -> str:
+    """Format errors as text lines using ty-style file:line:col: severity[code] message.
+
+    Dispatches once to a plain or colored formatter so the per-error loop carries no color branches.
+    """
+    formatter = _format_text_color if color else _format_text_plain
+    return formatter(errors)
+
+
 def _format_github(errors: list[dict]) -> str:
     """Format errors as GitHub Actions workflow commands."""
     lines = []
     for error in errors:
         severity = error.get("severity", "error")
-        code = error.get("code", "")
-        file_ = error["file"]
-        line = error["line"]
-        col = error["col"]
-        message = error["message"]
-        title = code or severity
-        lines.append(f"::{severity} file={file_},line={line},col={col},title={title}::{message}")
+        location = f"file={error['file']},line={error['line']},col={error['col']}"
+        title = error.get("code") or severity
+        lines.append(f"::{severity} {location},title={title}::{error['message']}")
     return "\n".join(lines)
 
 
@@ -105,6 +410,11 @@ def main(argv: list[str] | None = None) -> None:
         help=argparse.SUPPRESS,
     )
     check_parser.add_argument("--no-index", action="store_true", help="Disable cross-file index.")
+    check_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse results for unchanged files from a {_CACHE_DIR}/ directory inside the checked path.",
+    )
     check_parser.add_argument(
         "--no-warnings",
         action="store_true",
@@ -125,29 +435,46 @@ def main(argv: list[str] | None = None) -> None:
     _run_check(args)
 
 
-def _print_results(files: list[Path], all_errors: list[dict], elapsed: float, *, output_format: str) -> None:
-    """Print check results in the requested format."""
-    errors_only = [e for e in all_errors if e.get("severity") != "warning"]
-    warnings = [e for e in all_errors if e.get("severity") == "warning"]
+def _partition_errors(all_errors: list[dict]) -> tuple[list[dict], list[dict]]:
+    """Split checker results into ``(errors, warnings)`` in a single pass, preserving order."""
+    errors: list[dict] = []
+    warnings: list[dict] = []
+    error_append, warning_append = errors.append, warnings.append
+    for error in all_errors:
+        if error.get("severity") == "warning":
+            warning_append(error)
+        else:
+            error_append(error)
+    return errors, warnings
 
+
+def _print_results(
+    files: list[Path],
+    all_errors: list[dict],
+    elapsed: float,
+    *,
+    output_format: str,
+) -> None:
+    """Print check results in the requested format."""
+    is_tty = hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
     if output_format == "json":
-        print(json.dumps(all_errors, indent=2))
+        # Indentation only helps a human reading a terminal; piped consumers get compact JSON.
+        _write_json(all_errors, indent=is_tty)
         return
 
-    use_color = output_format == "text" and hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
-
     if output_format == "github":
         if all_errors:
-            print(_format_github(all_errors))
+            sys.stdout.write(_format_github(all_errors) + "\n")
         return
 
-    # text format
+    # text format: assemble everything and emit it with a single write
+    out = []
     if all_errors:
-        print(_format_text(all_errors, color=use_color))
-        print()
+        out.append(_format_text(all_errors, color=is_tty) + "\n\n")
 
     file_label = "file" if len(files) == 1 else "files"
-    if errors_only or warnings:
+    if all_errors:
+        errors_only, warnings = _partition_errors(all_errors)
         parts = []
         if errors_only:
             error_label = "error" if len(errors_only) == 1 else "errors"
@@ -157,17 +484,21 @@ def _print_results(files: list[Path], all_errors: list[dict], elapsed: float, *,
             parts.append(f"{len(warnings)} {warn_label}")
         summary = ", ".join(parts)
         msg = f"\u2717 Found {summary} in {len(files)} {file_label} ({elapsed:.1f}s)"
-        print(f"{_BOLD_RED}{msg}{_RESET}" if use_color else msg)
+        out.append(f"{_BOLD_RED}{msg}{_RESET}" if is_tty else msg)
     else:
         msg = f"\u2713 Checked {len(files)} {file_label} in {elapsed:.1f}s"
-        print(f"{_BOLD_GREEN}{msg}{_RESET}" if use_color else msg)
+        out.append(f"{_BOLD_GREEN}{msg}{_RESET}" if is_tty else msg)
+    out.append("\n")
+    sys.stdout.write("".join(out))
 
 
 def _run_check(args: argparse.Namespace) -> None:
     """Execute the check subcommand."""
     path: Path = args.path.resolve()
 
-    if not path.exists():
+    try:
+        is_dir = stat.S_ISDIR(path.stat().st_mode)
+    except OSError:
         original = args.path
         if original.is_absolute():
             print(f"Error: path does not exist: {path}", file=sys.stderr)
@@ -175,28 +506,25 @@ def _run_check(args: argparse.Namespace) -> None:
             print(f"Error: path does not exist: {original!r} (resolved to {path})", file=sys.stderr)
         sys.exit(2)
 
+    files = _collect_python_files(path, is_dir=is_dir)
+    cache_dir = (path if is_dir else path.parent) / _CACHE_DIR
     index_bytes: bytes | None = None
-    if path.is_dir() and not args.no_index:
-        try:
-            from typedframes._rust_checker import build_project_index  # ty: ignore[unresolved-import]
+    if files and is_dir and not args.no_index and index_enabled(path):
+        index_bytes = _build_index(path, files, cache_dir if args.cache else None)
 
-            index_bytes = build_project_index(str(path))
-        except ImportError:
-            pass
-
-    files = _collect_python_files(path)
+    warning_filters = {"include_warnings": not args.no_warnings, "include_ingest_warnings": args.strict_ingest}
     start = time.perf_counter()
-    all_errors = _check_files(files, index_bytes=index_bytes)
+    if args.cache:
+        cache_path = cache_dir / _CACHE_FILE
+        cache_key = _cache_key(files, index_bytes, **warning_filters)
+        cache = _load_cache(cache_path, cache_key)
+        all_errors = _check_files(files, index_bytes=index_bytes, cache=cache, **warning_filters)
+        _save_cache(cache_path, cache_key, {str(f): cache[str(f)] for f in files})
+    else:
+        all_errors = _check_files(files, index_bytes=index_bytes, **warning_filters)
     elapsed = time.perf_counter() - start
 
-    if not args.strict_ingest:
-        all_errors = [e for e in all_errors if e.get("code") != "untracked-dataframe"]
-
-    if args.no_warnings:
-        all_errors = [e for e in all_errors if e.get("severity") != "warning"]
-
-    errors_only = [e for e in all_errors if e.get("severity") != "warning"]
     _print_results(files, all_errors, elapsed, output_format=args.output_format)
 
-    if args.strict and errors_only:
+    if args.strict and any(error.get("severity") != "warning" for error in all_errors):
         sys.exit(1)
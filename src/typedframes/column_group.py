@@ -38,6 +38,9 @@ class ColumnGroup:
     members: list[Column | ColumnSet | ColumnGroup]
     description: str = ""
     name: str = field(default="", init=False)
+    _cols_cache: tuple[tuple[str, ...], list[pl.Expr]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __set_name__(self, owner: type, name: str) -> None:
         """Set the name attribute from the class attribute name."""
@@ -119,6 +122,13 @@ class ColumnGroup:
             df.select(SensorSchema.all_sensors.cols())
 
         """
+        # Expressions are immutable, so reuse them while the resolved names are unchanged; a warm cache implies
+        # polars imported fine before, so serve it without re-running the import statement
+        names = tuple(self.get_column_names(consumed_map))
+        cached = self._cols_cache
+        if cached is not None and cached[0] == names:
+            return list(cached[1])
+
         try:
             import polars as pl
         except ImportError:
@@ -127,5 +137,5 @@ class ColumnGroup:
             package = "polars"
             raise MissingDependencyError(package, "ColumnGroup.cols") from None
 
-        names = self.get_column_names(consumed_map)
-        return [pl.col(n) for n in names]
+        self._cols_cache = (names, [pl.col(n) for n in names])
+        return list(self._cols_cache[1])
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -9,7 +10,7 @@ if TYPE_CHECKING:
     import polars as pl
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnSet:
     r"""
     Represents a set of columns matching a pattern or explicit list.
@@ -39,11 +40,19 @@ class ColumnSet:
     regex: bool = False
     description: str = ""
     name: str = field(default="", init=False)
+    _cols_cache: tuple[tuple[str, ...], list[pl.Expr]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _compiled_cache: tuple[tuple[str, ...], tuple[re.Pattern[str], ...]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
-        """Normalize members to a list."""
+        """Normalize members to a list and, for regex sets, compile the patterns so invalid ones fail early."""
         if isinstance(self.members, str):
             self.members = [self.members]
+        if self.regex:
+            self.compiled()
 
     def __set_name__(self, owner: type, name: str) -> None:
         """Set the name attribute from the class attribute name."""
@@ -70,6 +79,23 @@ class ColumnSet:
             raise ValueError(msg)
         return list(self.members)
 
+    def compiled(self) -> tuple[re.Pattern[str], ...]:
+        """
+        Return the members compiled as regular expressions.
+
+        Compiled once and reused until ``members`` changes, so matching many column names does not go through
+        ``re``'s pattern cache on every call.
+
+        Raises:
+            re.error: If a member is not a valid regular expression.
+
+        """
+        members = tuple(self.members)
+        cached = self._compiled_cache
+        if cached is None or cached[0] != members:
+            cached = self._compiled_cache = (members, tuple(re.compile(p) for p in members))
+        return cached[1]
+
     def cols(self, matched_columns: list[str] | None = None) -> list[pl.Expr]:
         """
         Return polars column expressions for all columns in this set.
@@ -85,6 +111,11 @@ class ColumnSet:
             df.select(SensorSchema.temperatures.cols())
 
         """
+        # A warm cache implies polars imported fine before, so serve it without re-running the import statement
+        cached = self._cols_cache
+        if matched_columns is None and not self.regex and cached is not None and cached[0] == tuple(self.members):
+            return list(cached[1])
+
         try:
             import polars as pl
         except ImportError:
@@ -100,4 +131,7 @@ class ColumnSet:
             msg = "Cannot get column expressions for regex members without matched_columns"
             raise ValueError(msg)
 
-        return [pl.col(c) for c in self.members]
+        # Expressions are immutable, so build them once per members list and hand out shallow copies
+        members = tuple(self.members)
+        self._cols_cache = (members, [pl.col(c) for c in members])
+        return list(self._cols_cache[1])
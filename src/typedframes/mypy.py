@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Any
 
 from mypy.plugin import MethodContext, Plugin
 
+from typedframes._config import index_enabled
+
 if TYPE_CHECKING:
     from mypy.types import Type
 
@@ -49,11 +51,15 @@ class TypedFramesPlugin(Plugin):
         super().__init__(*args, **kwargs)
         self._checker_results: dict[str, list[dict[str, Any]]] = {}
         self._index_bytes_by_root: dict[str, bytes | None] = {}
+        self._check_file: Callable[[str, bytes | None], str] | None = None
 
     def _get_index_bytes(self, project_root: Path) -> bytes | None:
         """Build and cache the project index as MessagePack bytes, keyed by project root."""
         key = str(project_root)
         if key not in self._index_bytes_by_root:
+            if not index_enabled(project_root):
+                self._index_bytes_by_root[key] = None
+                return None
             try:
                 from typedframes._rust_checker import build_project_index  # ty: ignore[unresolved-import]
 
@@ -63,10 +69,12 @@ class TypedFramesPlugin(Plugin):
         return self._index_bytes_by_root[key]
 
     def _run_via_extension(self, file_path: str, index_bytes: bytes | None) -> list[dict[str, Any]]:
-        """Run the checker via the Rust extension module."""
-        from typedframes._rust_checker import check_file  # ty: ignore[unresolved-import]
+        """Run the checker via the Rust extension module, binding ``check_file`` on first use."""
+        if self._check_file is None:
+            from typedframes._rust_checker import check_file  # ty: ignore[unresolved-import]
 
-        result_json = str(check_file(file_path, index_bytes))
+            self._check_file = check_file
+        result_json = str(self._check_file(file_path, index_bytes))
         return json.loads(result_json)
 
     def _run_checker(self, file_path: str) -> list[dict[str, Any]]:
@@ -10,19 +10,31 @@ if TYPE_CHECKING:
     from .base_schema import BaseSchema
 
 
-def _map_dtype(python_type: type) -> type | None:
-    """Map a Python type to the corresponding pandera-compatible type.
+# Python types already resolved to pandera engine dtypes; filled lazily because pandera is optional
+_ENGINE_DTYPES: dict[Any, Any] = {}
+
+
+def _map_dtype(python_type: type) -> Any:
+    """Map a Python type to the corresponding pandera engine dtype.
+
+    Resolving through the pandas engine once per type lets every ``pa.Column`` built from it skip
+    re-parsing the Python type.
 
     Args:
         python_type: The Python type from a Column or ColumnSet definition.
 
     Returns:
-        The type to pass to pandera, or None if no type check should be applied.
+        The pandera engine dtype, or None if no type check should be applied.
 
     """
     if python_type is Any:
         return None
-    return python_type
+    dtype = _ENGINE_DTYPES.get(python_type)
+    if dtype is None:
+        from pandera.engines import pandas_engine
+
+        dtype = _ENGINE_DTYPES[python_type] = pandas_engine.Engine.dtype(python_type)
+    return dtype
 
 
 def to_pandera_schema(schema: type[BaseSchema]) -> pa.DataFrameSchema:
@@ -30,7 +42,11 @@ def to_pandera_schema(schema: type[BaseSchema]) -> pa.DataFrameSchema:
 
     Maps Column and ColumnSet definitions to pandera Column objects,
     enabling runtime validation using the same schema definitions
-    used for static analysis.
+    used for static analysis. The result is built once per schema class
+    and the same object is returned by later calls, so treat it as
+    read-only: ``copy.deepcopy`` it before making changes. Each subclass
+    gets its own schema; columns edited on a class after its first
+    conversion are not picked up.
 
     Args:
         schema: A BaseSchema subclass to convert.
@@ -59,21 +75,29 @@ def to_pandera_schema(schema: type[BaseSchema]) -> pa.DataFrameSchema:
         package = "pandera"
         raise MissingDependencyError(package, "to_pandera_schema") from None
 
-    columns: dict[str, pa.Column] = {}
+    # Read the class's own __dict__ so a subclass never picks up its parent's cached schema
+    cached = schema.__dict__.get("_pandera_schema")
+    if cached is not None:
+        return cached
+
+    # Collect (dtype, nullable, regex) per column name first so a name repeated across Columns and ColumnSets
+    # (e.g. a pattern redeclared in a subclass) builds a single pa.Column; the last definition wins as before.
+    specs: dict[str, tuple[Any, bool, bool]] = {}
 
     for col in schema.columns().values():
-        dtype = _map_dtype(col.type)
-        columns[col.column_name] = pa.Column(dtype=dtype, nullable=col.nullable)
+        specs[col.column_name] = (_map_dtype(col.type), col.nullable, False)
 
     for cs in schema.column_sets().values():
         dtype = _map_dtype(cs.type)
-        if cs.regex:
-            for pattern in cs.members:
-                columns[pattern] = pa.Column(dtype=dtype, nullable=False, regex=True)
-        else:
-            for member in cs.members:
-                columns[member] = pa.Column(dtype=dtype, nullable=False)
+        for member in cs.members:
+            specs[member] = (dtype, False, cs.regex)
+
+    columns = {
+        name: pa.Column(dtype=dtype, nullable=nullable, regex=regex) for name, (dtype, nullable, regex) in specs.items()
+    }
 
     strict = not schema.allow_extra_columns
 
-    return pa.DataFrameSchema(columns=columns, strict=strict)
+    pandera_schema = pa.DataFrameSchema(columns=columns, strict=strict)
+    type.__setattr__(schema, "_pandera_schema", pandera_schema)
+    return pandera_schema
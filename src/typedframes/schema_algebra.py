@@ -76,7 +76,7 @@ def combine_schemas(
 
     for cs_name, cs in schema_a.column_sets().items():
         attrs[cs_name] = ColumnSet(
-            members=cs.members.copy() if isinstance(cs.members, list) else cs.members,
+            members=cs.members.copy(),
             type=cs.type,
             regex=cs.regex,
             description=cs.description,
@@ -85,7 +85,7 @@ def combine_schemas(
     for cs_name, cs in schema_b.column_sets().items():
         if cs_name not in attrs:
             attrs[cs_name] = ColumnSet(
-                members=cs.members.copy() if isinstance(cs.members, list) else cs.members,
+                members=cs.members.copy(),
                 type=cs.type,
                 regex=cs.regex,
                 description=cs.description,
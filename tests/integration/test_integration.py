@@ -5,7 +5,10 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from typedframes._rust_checker import build_project_index, check_file  # ty: ignore[unresolved-import]
+from typedframes._rust_checker import build_project_index, check_file, check_files  # ty: ignore[unresolved-import]
+
+EXAMPLE_FILE = str(Path("examples/typedframes_example.py").absolute())
+INFERENCE_EXAMPLE_FILE = str(Path("examples/inference_example.py").absolute())
 
 
 class TestTypedFramesCheckerIntegration(unittest.TestCase):
@@ -14,7 +17,7 @@ class TestTypedFramesCheckerIntegration(unittest.TestCase):
     def test_should_detect_missing_column(self) -> None:
         """Test that the checker detects missing columns."""
         # arrange
-        example_file = str(Path("examples/typedframes_example.py").absolute())
+        example_file = EXAMPLE_FILE
 
         # act
         result = check_file(example_file)
@@ -25,7 +28,7 @@ class TestTypedFramesCheckerIntegration(unittest.TestCase):
     def test_should_suggest_typo_correction(self) -> None:
         """Test that the checker suggests corrections for typos."""
         # arrange
-        example_file = str(Path("examples/typedframes_example.py").absolute())
+        example_file = EXAMPLE_FILE
 
         # act
         result = check_file(example_file)
@@ -36,7 +39,7 @@ class TestTypedFramesCheckerIntegration(unittest.TestCase):
     def test_should_catch_polars_column_errors(self) -> None:
         """Test that the checker catches column errors in polars examples."""
         # arrange
-        example_file = str(Path("examples/typedframes_example.py").absolute())
+        example_file = EXAMPLE_FILE
 
         # act
         result = check_file(example_file)
@@ -47,7 +50,7 @@ class TestTypedFramesCheckerIntegration(unittest.TestCase):
     def test_should_run_via_python_extension(self) -> None:
         """Test that the Rust checker works via Python extension."""
         # arrange
-        example_file = str(Path("examples/typedframes_example.py").absolute())
+        example_file = EXAMPLE_FILE
 
         # act
         result = check_file(example_file)
@@ -56,6 +59,17 @@ class TestTypedFramesCheckerIntegration(unittest.TestCase):
         self.assertIn("wrong_column", result)
         self.assertIn("does not exist", result)
 
+    def test_should_check_a_batch_of_files_in_input_order(self) -> None:
+        """Test that check_files returns the same per-file results as check_file, in input order."""
+        # arrange
+        paths = [EXAMPLE_FILE, INFERENCE_EXAMPLE_FILE, EXAMPLE_FILE]
+
+        # act
+        results = check_files(paths)
+
+        # assert
+        self.assertEqual(results, [check_file(path) for path in paths])
+
     def test_should_warn_about_reserved_method_names(self) -> None:
         """Test that the checker warns about column names that shadow pandas/polars methods."""
         # arrange
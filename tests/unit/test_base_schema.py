@@ -1,6 +1,7 @@
 """Unit tests for BaseSchema class."""
 
 import unittest
+from unittest.mock import patch
 
 import pandas as pd
 import polars as pl
@@ -79,6 +80,78 @@ class TestBaseSchema(unittest.TestCase):
         # assert
         self.assertIs(first, second)
 
+    def test_should_cache_key_column_map_per_schema_class(self) -> None:
+        """Test that the column key map is built once per class and not shared with subclasses."""
+
+        # arrange
+        class ParentSchema(BaseSchema):
+            user_id = Column(type=int)
+
+        class ChildSchema(ParentSchema):
+            email = Column(type=str, alias="email_address")
+
+        # act
+        parent_first = ParentSchema._build_key_column_map()
+        parent_second = ParentSchema._build_key_column_map()
+        child = ChildSchema._build_key_column_map()
+
+        # assert
+        self.assertIs(parent_first, parent_second)
+        self.assertEqual(list(parent_first), ["user_id"])
+        self.assertEqual(list(child), ["user_id", "email_address"])
+
+    def test_should_reuse_column_map_for_same_column_layout(self) -> None:
+        """Test that compute_column_map matches a column layout once and returns independent copies."""
+
+        # arrange
+        class TestSchema(BaseSchema):
+            user_id = Column(type=int)
+            scores = ColumnSet(members=r"score_\d+", type=float, regex=True)
+
+        columns = ["user_id", "score_1", "score_2"]
+        first_types, first_consumed = TestSchema.compute_column_map(columns)
+        first_consumed["scores"].append("mutated")
+
+        # act
+        with patch.object(TestSchema, "_match_columns", side_effect=AssertionError("should be cached")):
+            second_types, second_consumed = TestSchema.compute_column_map(columns)
+
+        # assert
+        self.assertEqual(second_types, first_types)
+        self.assertEqual(second_consumed, {"scores": ["score_1", "score_2"]})
+
+    def test_should_reset_column_map_cache_when_full(self) -> None:
+        """Test that the per-class column map cache is cleared instead of growing without bound."""
+
+        # arrange
+        class TestSchema(BaseSchema):
+            scores = ColumnSet(members=r"score_\d+", type=float, regex=True)
+
+        # act
+        with patch("typedframes.base_schema._COLUMN_MAP_CACHE_SIZE", 1):
+            TestSchema.compute_column_map(["score_1"])
+            TestSchema.compute_column_map(["score_2"])
+
+        # assert
+        self.assertEqual(list(TestSchema._column_map_cache), [(("score_2",), False, ((("score_\\d+",), True),))])
+
+    def test_should_recompute_column_map_when_column_set_members_change(self) -> None:
+        """Test that editing a ColumnSet's members after a lookup is reflected by the next compute_column_map."""
+
+        # arrange
+        class TestSchema(BaseSchema):
+            temps = ColumnSet(members=["t1"], type=float)
+
+        columns = ["t1", "t2"]
+        TestSchema.compute_column_map(columns)
+
+        # act
+        TestSchema.column_sets()["temps"].members.append("t2")
+        _, consumed = TestSchema.compute_column_map(columns)
+
+        # assert
+        self.assertEqual(consumed, {"temps": ["t1", "t2"]})
+
     def test_should_return_all_column_names(self) -> None:
         """Test that all_column_names() returns column names including aliases."""
 
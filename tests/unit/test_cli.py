@@ -1,19 +1,66 @@
 """Unit tests for the typedframes CLI."""
 
-import builtins
 import json
+import os
+import sys
 import tempfile
 import unittest
-from io import StringIO
+from contextlib import redirect_stderr, redirect_stdout
+from io import BytesIO, StringIO, TextIOWrapper
 from pathlib import Path
-from unittest.mock import patch
-
-from typedframes.cli import _check_files, _collect_python_files, _format_github, _format_text, main
+from unittest.mock import MagicMock, patch
+
+import orjson
+
+from typedframes.cli import (
+    _build_index,
+    _cache_key,
+    _check_files,
+    _collect_python_files,
+    _dumps,
+    _format_github,
+    _format_text,
+    _import_orjson,
+    _load_cache,
+    _loads,
+    _partition_errors,
+    _save_cache,
+    main,
+)
 
 
 class TestCli(unittest.TestCase):
     """Unit tests for the CLI entry point."""
 
+    clean_py: Path
+    bad_py: Path
+    warn_py: Path
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Write the clean, erroring and warning files shared by tests that only read them."""
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        root = Path(cls._tmpdir.name)
+        cls.clean_py = root / "clean.py"
+        cls.clean_py.write_text("x = 1\n")
+        cls.bad_py = root / "bad.py"
+        cls.bad_py.write_text(
+            "from typedframes import BaseSchema, Column\n"
+            "\n"
+            "class S(BaseSchema):\n"
+            "    x = Column(type=int)\n"
+            "\n"
+            'df: "DataFrame[S]" = load()\n'
+            'df["wrong"]\n'
+        )
+        cls.warn_py = root / "warn.py"
+        cls.warn_py.write_text("import pandas as pd\ndf = pd.read_csv('x.csv')\n")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Remove the shared files."""
+        cls._tmpdir.cleanup()
+
     def test_should_print_help_when_no_command(self) -> None:
         """Test that running with no arguments prints help and exits 2."""
         # arrange / act / assert
@@ -35,7 +82,7 @@ class TestCli(unittest.TestCase):
 
         # act / assert
         with (
-            patch("sys.stderr", captured),
+            redirect_stderr(captured),
             self.assertRaises(SystemExit) as ctx,
         ):
             main(["check", "no/such/dir"])
@@ -46,48 +93,51 @@ class TestCli(unittest.TestCase):
     def test_should_exit_1_when_checker_not_installed(self) -> None:
         """Test that a helpful error is shown when typedframes-checker is missing."""
         # arrange
-        original_import = builtins.__import__
+        py_file = self.clean_py
 
-        def mock_import(name: str, *args: object, **kwargs: object) -> object:
-            if name == "typedframes._rust_checker":
-                raise ImportError(name)
-            return original_import(name, *args, **kwargs)
+        captured = StringIO()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "test.py"
-            py_file.write_text("x = 1\n")
+        # act / assert
+        with (
+            patch.dict(sys.modules, {"typedframes._rust_checker": None}),
+            redirect_stderr(captured),
+            self.assertRaises(SystemExit) as ctx,
+        ):
+            _check_files([py_file])
 
-            captured = StringIO()
+        self.assertEqual(ctx.exception.code, 1)
+        self.assertIn("Rust checker extension was not found", captured.getvalue())
 
-            # act / assert
-            with (
-                patch("builtins.__import__", side_effect=mock_import),
-                patch("sys.stderr", captured),
-                self.assertRaises(SystemExit) as ctx,
-            ):
-                _check_files([py_file])
+    def test_should_not_load_checker_when_there_are_no_files(self) -> None:
+        """Test that a directory without Python files is reported as clean without importing the extension."""
+        # arrange
+        captured = StringIO()
 
-            self.assertEqual(ctx.exception.code, 1)
-            self.assertIn("Rust checker extension was not found", captured.getvalue())
+        # act
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch.dict(sys.modules, {"typedframes._rust_checker": None}),
+            redirect_stdout(captured),
+        ):
+            main(["check", tmpdir])
+
+        # assert
+        self.assertIn("\u2713 Checked 0 files", captured.getvalue())
 
     def test_should_collect_single_python_file(self) -> None:
         """Test collecting a single .py file."""
         # arrange
-        with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "test.py"
-            py_file.write_text("x = 1")
+        py_file = self.clean_py
 
-            # act
-            result = _collect_python_files(py_file)
+        # act
+        result = _collect_python_files(py_file)
 
-            # assert
-            self.assertEqual(result, [py_file])
+        # assert
+        self.assertEqual(result, [py_file])
 
     def test_should_skip_non_python_file(self) -> None:
         """Test that non-.py files are skipped."""
         # arrange
-        import tempfile
-
         with tempfile.TemporaryDirectory() as tmpdir:
             txt_file = Path(tmpdir) / "data.txt"
             txt_file.write_text("hello")
@@ -101,8 +151,6 @@ class TestCli(unittest.TestCase):
     def test_should_collect_python_files_from_directory(self) -> None:
         """Test recursive collection of .py files from a directory."""
         # arrange
-        import tempfile
-
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
             (root / "a.py").write_text("x = 1")
@@ -120,6 +168,165 @@ class TestCli(unittest.TestCase):
             self.assertIn("a.py", names)
             self.assertIn("c.py", names)
 
+    def test_should_skip_ignored_directories_when_collecting(self) -> None:
+        """Test that files under venv, node_modules and __pycache__ are not collected."""
+        # arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a.py").write_text("x = 1")
+            for name in ("venv", "node_modules", "__pycache__"):
+                (root / name).mkdir()
+                (root / name / "b.py").write_text("y = 2")
+
+            # act
+            result = _collect_python_files(root)
+
+            # assert
+            self.assertEqual(result, [root / "a.py"])
+
+    def test_should_skip_hidden_directories_when_collecting(self) -> None:
+        """Test that files under hidden directories such as .venv are not collected."""
+        # arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a.py").write_text("x = 1")
+            hidden = root / ".venv"
+            hidden.mkdir()
+            (hidden / "site.py").write_text("y = 2")
+
+            # act
+            result = _collect_python_files(root)
+
+            # assert
+            self.assertEqual(result, [root / "a.py"])
+
+    def test_should_skip_hidden_files_when_collecting(self) -> None:
+        """Test that dot-prefixed .py files are not collected, unlike the earlier rglob walk."""
+        # arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a.py").write_text("x = 1")
+            (root / ".scratch.py").write_text("y = 2")
+
+            # act
+            result = _collect_python_files(root)
+
+            # assert
+            self.assertEqual(result, [root / "a.py"])
+
+    def test_should_not_follow_symlinked_directories_when_collecting(self) -> None:
+        """Test that symlinked directories are not walked while symlinks to .py files are kept."""
+        # arrange
+        with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as outside_dir:
+            root = Path(tmpdir)
+            outside = Path(outside_dir)
+            (outside / "linked_mod.py").write_text("x = 1")
+            (outside / "linked_file.py").write_text("y = 2")
+            (root / "linked_dir").symlink_to(outside, target_is_directory=True)
+            (root / "main.py").symlink_to(outside / "linked_file.py")
+
+            # act
+            result = _collect_python_files(root)
+
+            # assert
+            self.assertEqual(result, [root / "main.py"])
+
+    def test_should_skip_unreadable_directories_when_collecting(self) -> None:
+        """Test that a subdirectory that cannot be listed is skipped instead of aborting the walk."""
+        # arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a.py").write_text("x = 1")
+            locked = root / "locked"
+            locked.mkdir()
+            (locked / "b.py").write_text("y = 2")
+            real_scandir = os.scandir
+
+            def scandir(path: str) -> object:
+                if path == str(locked):
+                    raise PermissionError(path)
+                return real_scandir(path)
+
+            # act
+            with patch("typedframes.cli.os.scandir", side_effect=scandir):
+                result = _collect_python_files(root)
+
+            # assert
+            self.assertEqual(result, [root / "a.py"])
+
+    def test_should_return_errors_in_file_order_when_checking_many_files(self) -> None:
+        """Test that checking files concurrently still reports errors in the order the files were given."""
+        # arrange
+        source = (
+            "from typedframes import BaseSchema, Column\n"
+            "\n"
+            "class S(BaseSchema):\n"
+            "    x = Column(type=int)\n"
+            "\n"
+            'df: "DataFrame[S]" = load()\n'
+            'df["wrong"]\n'
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = [Path(tmpdir) / f"bad_{i}.py" for i in range(8)]
+            for py_file in files:
+                py_file.write_text(source)
+
+            # act
+            result = _check_files(files)
+
+            # assert
+            self.assertEqual([e["file"] for e in result], [str(f) for f in files])
+
+    def test_should_import_orjson_only_when_installed(self) -> None:
+        """Test that the optional orjson module is returned when importable and None otherwise."""
+        # act
+        installed = _import_orjson()
+        with patch.dict(sys.modules, {"orjson": None}):
+            missing = _import_orjson()
+
+        # assert
+        self.assertIs(installed, orjson)
+        self.assertIsNone(missing)
+
+    def test_should_decode_with_orjson_when_installed(self) -> None:
+        """Test that checker output is decoded by the installed orjson module."""
+        # act
+        with patch("typedframes.cli.orjson", wraps=orjson) as spy:
+            result = _loads('[{"line": 1, "message": "caf\u00e9"}]')
+
+        # assert
+        spy.loads.assert_called_once()
+        self.assertEqual(result, [{"line": 1, "message": "caf\u00e9"}])
+
+    def test_should_encode_identically_with_and_without_orjson(self) -> None:
+        """Test that orjson and the stdlib fallback produce the same JSON text, indented or compact."""
+        # arrange
+        errors = [{"file": "caf\u00e9.py", "line": 1, "message": 'Column "x" \u2028', "severity": "error"}]
+
+        # act
+        with_orjson = [_dumps(errors), _dumps(errors, indent=False), _dumps([])]
+        with patch("typedframes.cli.orjson", None):
+            without_orjson = [_dumps(errors), _dumps(errors, indent=False), _dumps([])]
+
+        # assert
+        self.assertEqual(with_orjson, without_orjson)
+        self.assertEqual(json.loads(with_orjson[1]), errors)
+        self.assertIn("caf\u00e9.py", with_orjson[1])
+
+    def test_should_fall_back_to_stdlib_json_without_orjson(self) -> None:
+        """Test that the stdlib json module is used when orjson is not installed."""
+        # arrange
+        errors = [{"line": 1, "message": "bad"}]
+
+        # act
+        with patch("typedframes.cli.orjson", None):
+            encoded = _dumps(errors)
+            decoded = _loads(encoded)
+
+        # assert
+        self.assertEqual(encoded, json.dumps(errors, indent=2))
+        self.assertEqual(decoded, errors)
+
     def test_should_format_text_errors(self) -> None:
         """Test text error formatting uses ty-style file:line:col: severity[code] message."""
         # arrange
@@ -231,40 +438,34 @@ class TestCli(unittest.TestCase):
     def test_should_output_json_when_flag_set(self) -> None:
         """Test JSON output mode via --json flag."""
         # arrange
-        import tempfile
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "clean.py"
-            py_file.write_text("x = 1\n")
+        py_file = self.clean_py
 
-            captured = StringIO()
+        captured = StringIO()
 
-            # act
-            with patch("sys.stdout", captured):
-                main(["check", str(py_file), "--json"])
+        # act
+        with redirect_stdout(captured):
+            main(["check", str(py_file), "--json"])
 
-            # assert
-            output = captured.getvalue()
-            parsed = json.loads(output)
-            self.assertIsInstance(parsed, list)
+        # assert
+        output = captured.getvalue()
+        parsed = json.loads(output)
+        self.assertIsInstance(parsed, list)
 
     def test_should_output_json_when_output_format_json(self) -> None:
         """Test JSON output mode via --output-format json."""
         # arrange
-        with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "clean.py"
-            py_file.write_text("x = 1\n")
+        py_file = self.clean_py
 
-            captured = StringIO()
+        captured = StringIO()
 
-            # act
-            with patch("sys.stdout", captured):
-                main(["check", str(py_file), "--output-format", "json"])
+        # act
+        with redirect_stdout(captured):
+            main(["check", str(py_file), "--output-format", "json"])
 
-            # assert
-            output = captured.getvalue()
-            parsed = json.loads(output)
-            self.assertIsInstance(parsed, list)
+        # assert
+        output = captured.getvalue()
+        parsed = json.loads(output)
+        self.assertIsInstance(parsed, list)
 
     def test_should_output_github_format(self) -> None:
         """Test GitHub Actions annotation output via --output-format github."""
@@ -277,156 +478,110 @@ class TestCli(unittest.TestCase):
             "message": "Column 'x' not found",
             "severity": "error",
         }
-        with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "f.py"
-            py_file.write_text("x = 1\n")
+        py_file = self.clean_py
 
-            captured = StringIO()
+        captured = StringIO()
 
-            # act
-            with (
-                patch("typedframes.cli._check_files", return_value=[error]),
-                patch("sys.stdout", captured),
-            ):
-                main(["check", str(py_file), "--output-format", "github"])
+        # act
+        with (
+            patch("typedframes.cli._check_files", return_value=[error]),
+            redirect_stdout(captured),
+        ):
+            main(["check", str(py_file), "--output-format", "github"])
 
-            # assert
-            output = captured.getvalue()
-            self.assertIn("::error file=f.py,line=5,col=4,title=unknown-column::Column 'x' not found", output)
+        # assert
+        output = captured.getvalue()
+        self.assertIn("::error file=f.py,line=5,col=4,title=unknown-column::Column 'x' not found", output)
 
     def test_should_output_github_format_clean_file(self) -> None:
         """Test GitHub Actions format with no errors produces no annotation output."""
         # arrange
-        with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "clean.py"
-            py_file.write_text("x = 1\n")
+        py_file = self.clean_py
 
-            captured = StringIO()
+        captured = StringIO()
 
-            # act
-            with patch("sys.stdout", captured):
-                main(["check", str(py_file), "--output-format", "github"])
+        # act
+        with redirect_stdout(captured):
+            main(["check", str(py_file), "--output-format", "github"])
 
-            # assert — no annotation lines emitted for clean file
-            output = captured.getvalue()
-            self.assertNotIn("::", output)
+        # assert — no annotation lines emitted for clean file
+        output = captured.getvalue()
+        self.assertNotIn("::", output)
 
     def test_should_exit_0_when_strict_and_no_errors(self) -> None:
         """Test that --strict exits 0 when there are no errors."""
         # arrange
-        import tempfile
+        py_file = self.clean_py
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "clean.py"
-            py_file.write_text("x = 1\n")
-
-            # act / assert — should not raise SystemExit
-            main(["check", str(py_file), "--strict"])
+        # act / assert — should not raise SystemExit
+        main(["check", str(py_file), "--strict"])
 
     def test_should_exit_1_when_strict_and_errors(self) -> None:
         """Test that --strict exits 1 when there are errors."""
         # arrange
-        import tempfile
+        py_file = self.bad_py
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "bad.py"
-            py_file.write_text(
-                "from typedframes import BaseSchema, Column\n"
-                "\n"
-                "class S(BaseSchema):\n"
-                "    x = Column(type=int)\n"
-                "\n"
-                'df: "DataFrame[S]" = load()\n'
-                'df["wrong"]\n'
-            )
-
-            # act / assert
-            with self.assertRaises(SystemExit) as ctx:
-                main(["check", str(py_file), "--strict"])
-            self.assertEqual(ctx.exception.code, 1)
+        # act / assert
+        with self.assertRaises(SystemExit) as ctx:
+            main(["check", str(py_file), "--strict"])
+        self.assertEqual(ctx.exception.code, 1)
 
     def test_should_print_summary_for_clean_files(self) -> None:
         """Test that a summary line is printed for clean files."""
         # arrange
-        import tempfile
+        py_file = self.clean_py
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "clean.py"
-            py_file.write_text("x = 1\n")
-
-            captured = StringIO()
+        captured = StringIO()
 
-            # act
-            with patch("sys.stdout", captured):
-                main(["check", str(py_file)])
+        # act
+        with redirect_stdout(captured):
+            main(["check", str(py_file)])
 
-            # assert
-            output = captured.getvalue()
-            self.assertIn("\u2713 Checked 1 file", output)
+        # assert
+        output = captured.getvalue()
+        self.assertIn("\u2713 Checked 1 file", output)
 
     def test_should_print_error_count_for_bad_files(self) -> None:
         """Test that error count is printed for files with errors."""
         # arrange
-        import tempfile
+        py_file = self.bad_py
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "bad.py"
-            py_file.write_text(
-                "from typedframes import BaseSchema, Column\n"
-                "\n"
-                "class S(BaseSchema):\n"
-                "    x = Column(type=int)\n"
-                "\n"
-                'df: "DataFrame[S]" = load()\n'
-                'df["wrong"]\n'
-            )
-
-            captured = StringIO()
+        captured = StringIO()
 
-            # act
-            with patch("sys.stdout", captured):
-                main(["check", str(py_file)])
+        # act
+        with redirect_stdout(captured):
+            main(["check", str(py_file)])
 
-            # assert
-            output = captured.getvalue()
-            self.assertIn("\u2717 Found 1 error", output)
+        # assert
+        output = captured.getvalue()
+        self.assertIn("\u2717 Found 1 error", output)
 
     def test_should_print_warning_count_in_summary(self) -> None:
         """Test that warning count appears in the summary line."""
         # arrange
-        import tempfile
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "warn.py"
-            py_file.write_text("import pandas as pd\ndf = pd.read_csv('x.csv')\n")
+        py_file = self.warn_py
 
-            captured = StringIO()
+        captured = StringIO()
 
-            # act
-            with patch("sys.stdout", captured):
-                main(["check", str(py_file), "--no-index", "--strict-ingest"])
+        # act
+        with redirect_stdout(captured):
+            main(["check", str(py_file), "--no-index", "--strict-ingest"])
 
-            # assert
-            output = captured.getvalue()
-            self.assertIn("1 warning", output)
+        # assert
+        output = captured.getvalue()
+        self.assertIn("1 warning", output)
 
     def test_should_not_exit_1_when_strict_and_only_warnings(self) -> None:
         """Test that --strict does not exit 1 when there are only warnings (no errors)."""
         # arrange
-        import tempfile
+        py_file = self.warn_py
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "warn.py"
-            py_file.write_text("import pandas as pd\ndf = pd.read_csv('x.csv')\n")
-
-            # act / assert — should not raise SystemExit(1)
-            main(["check", str(py_file), "--strict", "--no-index"])
+        # act / assert — should not raise SystemExit(1)
+        main(["check", str(py_file), "--strict", "--no-index"])
 
     def test_should_check_directory(self) -> None:
         """Test checking an entire directory."""
         # arrange
-        import tempfile
-
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
             (root / "a.py").write_text("x = 1\n")
@@ -435,7 +590,7 @@ class TestCli(unittest.TestCase):
             captured = StringIO()
 
             # act
-            with patch("sys.stdout", captured):
+            with redirect_stdout(captured):
                 main(["check", str(root)])
 
             # assert
@@ -445,8 +600,6 @@ class TestCli(unittest.TestCase):
     def test_should_check_directory_with_no_index(self) -> None:
         """Test that --no-index skips building the project index."""
         # arrange
-        import tempfile
-
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
             (root / "a.py").write_text("x = 1\n")
@@ -454,42 +607,52 @@ class TestCli(unittest.TestCase):
             captured = StringIO()
 
             # act
-            with patch("sys.stdout", captured):
+            with redirect_stdout(captured):
                 main(["check", str(root), "--no-index"])
 
             # assert
             output = captured.getvalue()
             self.assertIn("\u2713 Checked 1 file", output)
 
-    def test_should_suppress_warnings_with_no_warnings_flag(self) -> None:
-        """Test that --no-warnings suppresses untracked-dataframe/dropped-unknown-column warnings from output."""
+    def test_should_skip_index_when_disabled_in_pyproject(self) -> None:
+        """Test that build_index = false in pyproject.toml skips building the project index."""
         # arrange
         with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "warn.py"
-            py_file.write_text("import pandas as pd\ndf = pd.read_csv('x.csv')\n")
-
+            root = Path(tmpdir)
+            (root / "pyproject.toml").write_text("[tool.typedframes]\nbuild_index = false\n")
+            (root / "a.py").write_text("x = 1\n")
             captured = StringIO()
 
             # act
-            with patch("sys.stdout", captured):
-                main(["check", str(py_file), "--no-index", "--no-warnings"])
+            with (
+                patch("typedframes.cli._build_index") as build_index,
+                redirect_stdout(captured),
+            ):
+                main(["check", str(root)])
 
             # assert
-            output = captured.getvalue()
-            self.assertNotIn("warning", output)
-            self.assertIn("\u2713 Checked 1 file", output)
+            build_index.assert_not_called()
+            self.assertIn("\u2713 Checked 1 file", captured.getvalue())
+
+    def test_should_suppress_warnings_with_no_warnings_flag(self) -> None:
+        """Test that --no-warnings suppresses untracked-dataframe/dropped-unknown-column warnings from output."""
+        # arrange
+        py_file = self.warn_py
+
+        captured = StringIO()
+
+        # act
+        with redirect_stdout(captured):
+            main(["check", str(py_file), "--no-index", "--no-warnings"])
+
+        # assert
+        output = captured.getvalue()
+        self.assertNotIn("warning", output)
+        self.assertIn("\u2713 Checked 1 file", output)
 
     def test_should_still_show_errors_with_no_warnings_flag(self) -> None:
         """Test that --no-warnings suppresses warnings but preserves errors."""
         # arrange
-        warning_error = {
-            "file": "mixed.py",
-            "line": 2,
-            "col": 0,
-            "code": "dropped-unknown-column",
-            "message": "Dropped column 'x' does not exist in Schema",
-            "severity": "warning",
-        }
         actual_error = {
             "file": "mixed.py",
             "line": 7,
@@ -499,28 +662,46 @@ class TestCli(unittest.TestCase):
             "severity": "error",
         }
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "mixed.py"
-            py_file.write_text("x = 1\n")
+        py_file = self.clean_py
 
-            captured = StringIO()
+        captured = StringIO()
 
-            # act
-            with (
-                patch("typedframes.cli._check_files", return_value=[warning_error, actual_error]),
-                patch("sys.stdout", captured),
-            ):
-                main(["check", str(py_file), "--no-warnings"])
+        # act
+        with (
+            patch("typedframes.cli._check_files", return_value=[actual_error]) as check_files,
+            redirect_stdout(captured),
+        ):
+            main(["check", str(py_file), "--no-warnings"])
 
-            # assert
-            output = captured.getvalue()
-            self.assertNotIn("Dropped column", output)
-            self.assertIn("Column 'wrong'", output)
-            self.assertIn("1 error", output)
+        # assert
+        output = captured.getvalue()
+        self.assertFalse(check_files.call_args.kwargs["include_warnings"])
+        self.assertNotIn("Dropped column", output)
+        self.assertIn("Column 'wrong'", output)
+        self.assertIn("1 error", output)
 
     def test_should_suppress_untracked_dataframe_by_default(self) -> None:
         """Test that untracked-dataframe warnings are suppressed by default."""
         # arrange
+        py_file = self.clean_py
+        captured = StringIO()
+
+        # act
+        with (
+            patch("typedframes.cli._check_files", return_value=[]) as check_files,
+            redirect_stdout(captured),
+        ):
+            main(["check", str(py_file)])
+
+        # assert
+        output = captured.getvalue()
+        self.assertFalse(check_files.call_args.kwargs["include_ingest_warnings"])
+        self.assertTrue(check_files.call_args.kwargs["include_warnings"])
+        self.assertIn("\u2713 Checked 1 file", output)
+
+    def test_should_show_untracked_dataframe_with_strict_ingest_flag(self) -> None:
+        """Test that --strict-ingest enables untracked-dataframe warnings."""
+        # arrange
         w = {
             "file": "f.py",
             "line": 1,
@@ -529,73 +710,371 @@ class TestCli(unittest.TestCase):
             "message": "columns unknown at lint time",
             "severity": "warning",
         }
+        py_file = self.clean_py
+        captured = StringIO()
+
+        # act
+        with (
+            patch("typedframes.cli._check_files", return_value=[w]) as check_files,
+            redirect_stdout(captured),
+        ):
+            main(["check", str(py_file), "--strict-ingest"])
+
+        # assert
+        output = captured.getvalue()
+        self.assertTrue(check_files.call_args.kwargs["include_ingest_warnings"])
+        self.assertIn("columns unknown at lint time", output)
+
+    def test_should_not_crash_when_checker_not_installed_on_directory(self) -> None:
+        """Test that a missing Rust extension when checking a directory exits with code 1."""
+        # arrange
         with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "f.py"
+            py_file = Path(tmpdir) / "test.py"
             py_file.write_text("x = 1\n")
+
             captured = StringIO()
 
+            # act / assert
+            with (
+                patch.dict(sys.modules, {"typedframes._rust_checker": None}),
+                redirect_stderr(captured),
+                self.assertRaises(SystemExit) as ctx,
+            ):
+                main(["check", str(tmpdir)])
+
+            self.assertEqual(ctx.exception.code, 1)
+            self.assertIn("Rust checker extension was not found", captured.getvalue())
+
+    def test_should_reuse_cached_results_for_unchanged_files(self) -> None:
+        """Test that --cache reuses stored results instead of re-running the checker on an unchanged file."""
+        # arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            py_file = Path(tmpdir) / "bad.py"
+            py_file.write_text(
+                "from typedframes import BaseSchema, Column\n"
+                "\n"
+                "class S(BaseSchema):\n"
+                "    x = Column(type=int)\n"
+                "\n"
+                'df: "DataFrame[S]" = load()\n'
+                'df["wrong"]\n'
+            )
+            first = StringIO()
+            with redirect_stdout(first):
+                main(["check", str(py_file), "--cache", "--output-format", "json"])
+            failing_checker = MagicMock(check_files=MagicMock(side_effect=AssertionError("checker should not run")))
+            second = StringIO()
+
             # act
             with (
-                patch("typedframes.cli._check_files", return_value=[w]),
-                patch("sys.stdout", captured),
+                patch.dict(sys.modules, {"typedframes._rust_checker": failing_checker}),
+                redirect_stdout(second),
             ):
-                main(["check", str(py_file)])
+                main(["check", str(py_file), "--cache", "--output-format", "json"])
 
             # assert
-            output = captured.getvalue()
-            self.assertNotIn("columns unknown at lint time", output)
-            self.assertIn("\u2713 Checked 1 file", output)
+            self.assertEqual(len(json.loads(first.getvalue())), 1)
+            self.assertEqual(json.loads(second.getvalue()), json.loads(first.getvalue()))
+            self.assertTrue((Path(tmpdir) / ".typedframes_cache" / "v2.json").exists())
 
-    def test_should_show_untracked_dataframe_with_strict_ingest_flag(self) -> None:
-        """Test that --strict-ingest enables untracked-dataframe warnings."""
+    def test_should_recheck_modified_files_with_cache(self) -> None:
+        """Test that --cache re-runs the checker when a file changes after being cached."""
         # arrange
-        w = {
-            "file": "f.py",
-            "line": 1,
-            "col": 0,
-            "code": "untracked-dataframe",
-            "message": "columns unknown at lint time",
-            "severity": "warning",
-        }
         with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "f.py"
+            py_file = Path(tmpdir) / "mod.py"
+            py_file.write_text(
+                "from typedframes import BaseSchema, Column\n"
+                "\n"
+                "class S(BaseSchema):\n"
+                "    x = Column(type=int)\n"
+                "\n"
+                'df: "DataFrame[S]" = load()\n'
+                'df["wrong"]\n'
+            )
+            with redirect_stdout(StringIO()):
+                main(["check", str(py_file), "--cache"])
             py_file.write_text("x = 1\n")
             captured = StringIO()
 
             # act
-            with (
-                patch("typedframes.cli._check_files", return_value=[w]),
-                patch("sys.stdout", captured),
-            ):
-                main(["check", str(py_file), "--strict-ingest"])
+            with redirect_stdout(captured):
+                main(["check", str(py_file), "--cache"])
 
             # assert
-            output = captured.getvalue()
-            self.assertIn("columns unknown at lint time", output)
+            self.assertIn("\u2713 Checked 1 file", captured.getvalue())
 
-    def test_should_not_crash_when_checker_not_installed_on_directory(self) -> None:
-        """Test that a missing Rust extension when checking a directory exits with code 1."""
+    def test_should_ignore_missing_corrupt_or_stale_cache(self) -> None:
+        """Test that an unusable cache file yields an empty cache."""
         # arrange
-        original_import = builtins.__import__
+        with tempfile.TemporaryDirectory() as tmpdir:
+            missing = Path(tmpdir) / "missing.json"
+            corrupt = Path(tmpdir) / "corrupt.json"
+            corrupt.write_text("{not json")
+            not_a_dict = Path(tmpdir) / "list.json"
+            not_a_dict.write_text("[]")
+            stale = Path(tmpdir) / "stale.json"
+            stale.write_text(json.dumps({"results": {"old": {"a.py": [1, 2, []]}}}))
+            bad_entries = Path(tmpdir) / "bad_entries.json"
+            bad_entries.write_text(json.dumps({"results": {"new": []}}))
 
-        def mock_import(name: str, *args: object, **kwargs: object) -> object:
-            if name == "typedframes._rust_checker":
-                raise ImportError(name)
-            return original_import(name, *args, **kwargs)
+            # act
+            results = [_load_cache(p, "new") for p in (missing, corrupt, not_a_dict, stale, bad_entries)]
+
+            # assert
+            self.assertEqual(results, [{}, {}, {}, {}, {}])
 
+    def test_should_round_trip_cache_entries(self) -> None:
+        """Test that saved cache entries load back under the same key."""
+        # arrange
+        entries = {"a.py": [1, 2, [{"line": 1}]]}
         with tempfile.TemporaryDirectory() as tmpdir:
-            py_file = Path(tmpdir) / "test.py"
-            py_file.write_text("x = 1\n")
+            cache_path = Path(tmpdir) / ".typedframes_cache" / "v2.json"
+
+            # act
+            _save_cache(cache_path, "key", entries)
+
+            # assert
+            self.assertEqual(_load_cache(cache_path, "key"), entries)
+            self.assertEqual((cache_path.parent / ".gitignore").read_text(), "*\n")
+
+    def test_should_not_raise_when_cache_cannot_be_written(self) -> None:
+        """Test that filesystem errors while saving the cache are ignored."""
+        # arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            blocker = Path(tmpdir) / "file.txt"
+            blocker.write_text("not a directory")
+            cache_path = blocker / ".typedframes_cache" / "v2.json"
+
+            # act
+            _save_cache(cache_path, "key", {})
+
+            # assert
+            self.assertFalse(cache_path.exists())
+
+    def test_should_change_cache_key_when_pyproject_changes(self) -> None:
+        """Test that editing the nearest pyproject.toml invalidates cached results."""
+        # arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            files = [root / "a.py"]
+            without_config = _cache_key(files, None)
+            (root / "pyproject.toml").write_text("[tool.typedframes]\nwarnings = false\n")
+
+            # act
+            with_config = _cache_key(files, None)
 
+            # assert
+            self.assertNotEqual(without_config, with_config)
+            self.assertNotEqual(with_config, _cache_key(files, b"index"))
+
+    def test_should_change_cache_key_when_nested_pyproject_changes(self) -> None:
+        """Test that a pyproject.toml below the checked root is part of the key for the files that resolve to it."""
+        # arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "pyproject.toml").write_text("[tool.typedframes]\n")
+            nested = root / "sub" / "pkg"
+            nested.mkdir(parents=True)
+            (root / "sub" / "pyproject.toml").write_text("[tool.typedframes]\nwarnings = true\n")
+            files = [root / "a.py", root / "sub" / "b.py", nested / "c.py", nested / "d.py"]
+            before = _cache_key(files, None)
+            root_only_before = _cache_key([root / "a.py"], None)
+            (root / "sub" / "pyproject.toml").write_text("[tool.typedframes]\nwarnings = false\n")
+
+            # act
+            after = _cache_key(files, None)
+            root_only_after = _cache_key([root / "a.py"], None)
+
+            # assert
+            self.assertNotEqual(before, after)
+            self.assertEqual(root_only_before, root_only_after)
+
+    def test_should_change_cache_key_when_warning_filters_change(self) -> None:
+        """Test that results cached with one warning filter are not reused under another."""
+        # arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = [Path(tmpdir) / "a.py"]
+
+            # act
+            default = _cache_key(files, None)
+            strict = _cache_key(files, None, include_ingest_warnings=False)
+
+            # assert
+            self.assertNotEqual(default, strict)
+            self.assertNotEqual(default, _cache_key(files, None, include_warnings=False))
+
+    def test_should_keep_cached_results_for_other_keys(self) -> None:
+        """Test that saving results under one key keeps the most recent results saved under other keys."""
+        # arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / ".typedframes_cache" / "v2.json"
+            for i in range(5):
+                _save_cache(cache_path, f"key{i}", {"a.py": [i, 0, []]})
+
+            # act
+            _save_cache(cache_path, "key1", {"a.py": [9, 0, []]})
+
+            # assert
+            self.assertEqual(_load_cache(cache_path, "key0"), {})
+            self.assertEqual(_load_cache(cache_path, "key1"), {"a.py": [9, 0, []]})
+            self.assertEqual(_load_cache(cache_path, "key4"), {"a.py": [4, 0, []]})
+            self.assertEqual(_load_cache(cache_path, "key2"), {"a.py": [2, 0, []]})
+
+    def test_should_keep_single_file_results_cached_after_directory_run(self) -> None:
+        """Test that a directory run sharing the cache directory does not evict a single-file run's results."""
+        # arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            py_file = Path(tmpdir) / "mod.py"
+            py_file.write_text("x = 1\n")
+            with redirect_stdout(StringIO()):
+                main(["check", str(py_file), "--cache"])
+                main(["check", tmpdir, "--cache"])
+            failing_checker = MagicMock(
+                build_project_index=MagicMock(return_value=b""),
+                check_files=MagicMock(side_effect=AssertionError("checker should not run")),
+            )
             captured = StringIO()
 
-            # act / assert
-            with (
-                patch("builtins.__import__", side_effect=mock_import),
-                patch("sys.stderr", captured),
-                self.assertRaises(SystemExit) as ctx,
-            ):
-                main(["check", str(tmpdir)])
+            # act
+            with patch.dict(sys.modules, {"typedframes._rust_checker": failing_checker}), redirect_stdout(captured):
+                main(["check", str(py_file), "--cache"])
 
-            self.assertEqual(ctx.exception.code, 1)
-            self.assertIn("Rust checker extension was not found", captured.getvalue())
+            # assert
+            self.assertIn("\u2713 Checked 1 file", captured.getvalue())
+
+    def test_should_drop_warnings_in_checker_when_filtered(self) -> None:
+        """Test that the warning filters are applied by the checker itself."""
+        # arrange
+        py_file = self.warn_py
+
+        # act
+        unfiltered = _check_files([py_file])
+        filtered = _check_files([py_file], include_ingest_warnings=False)
+
+        # assert
+        self.assertIn("untracked-dataframe", [e["code"] for e in unfiltered])
+        self.assertEqual(filtered, [])
+
+    def test_should_partition_errors_and_warnings_in_order(self) -> None:
+        """Test that _partition_errors splits by severity, treating a missing severity as an error."""
+        # arrange
+        first = {"code": "a", "severity": "error"}
+        warning = {"code": "b", "severity": "warning"}
+        untagged = {"code": "c"}
+
+        # act
+        errors, warnings = _partition_errors([first, warning, untagged])
+
+        # assert
+        self.assertEqual(errors, [first, untagged])
+        self.assertEqual(warnings, [warning])
+
+    def test_should_write_compact_json_when_piped_and_indented_on_a_tty(self) -> None:
+        """Test that --output-format json is only indented when stdout is a terminal."""
+        # arrange
+        error = {"file": "f.py", "line": 1, "col": 0, "code": "unknown-column", "message": "m", "severity": "error"}
+        piped = StringIO()
+        terminal = StringIO()
+        terminal.isatty = lambda: True
+
+        py_file = self.clean_py
+
+        # act
+        with patch("typedframes.cli._check_files", return_value=[error]):
+            with redirect_stdout(piped):
+                main(["check", str(py_file), "--output-format", "json"])
+            with redirect_stdout(terminal):
+                main(["check", str(py_file), "--output-format", "json"])
+
+        # assert
+        self.assertEqual(piped.getvalue().count("\n"), 1)
+        self.assertGreater(terminal.getvalue().count("\n"), 1)
+        self.assertEqual(json.loads(piped.getvalue()), json.loads(terminal.getvalue()))
+
+    def test_should_write_same_utf8_bytes_to_binary_stdout_with_and_without_orjson(self) -> None:
+        """Test that JSON output bypasses the text layer and is byte-identical whether or not orjson is installed."""
+        # arrange
+        error = {
+            "file": "caf\u00e9.py",
+            "line": 1,
+            "col": 0,
+            "code": "unknown-column",
+            "message": "m",
+            "severity": "error",
+        }
+        # an ASCII text layer would raise on the non-ASCII path if output went through it
+        with_orjson = TextIOWrapper(BytesIO(), encoding="ascii")
+        without_orjson = TextIOWrapper(BytesIO(), encoding="ascii")
+
+        # act
+        with patch("typedframes.cli._check_files", return_value=[error]):
+            with redirect_stdout(with_orjson):
+                main(["check", str(self.clean_py), "--output-format", "json"])
+            with patch("typedframes.cli.orjson", None), redirect_stdout(without_orjson):
+                main(["check", str(self.clean_py), "--output-format", "json"])
+
+        # assert
+        self.assertEqual(with_orjson.buffer.getvalue(), without_orjson.buffer.getvalue())
+        self.assertEqual(with_orjson.buffer.getvalue(), orjson.dumps([error]) + b"\n")
+
+    def test_should_reuse_cached_index_when_files_are_unchanged(self) -> None:
+        """Test that the project index is read from the cache instead of rebuilt when no file changed."""
+        # arrange
+        mock_build = MagicMock(return_value=b"index-bytes")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a.py").write_text("x = 1\n")
+            files = [root / "a.py"]
+            cache_dir = root / ".typedframes_cache"
+
+            # act
+            with patch.dict(sys.modules, {"typedframes._rust_checker": MagicMock(build_project_index=mock_build)}):
+                first = _build_index(root, files, cache_dir)
+                second = _build_index(root, files, cache_dir)
+
+        # assert
+        mock_build.assert_called_once_with(str(root), [str(root / "a.py")])
+        self.assertEqual(first, b"index-bytes")
+        self.assertEqual(second, b"index-bytes")
+
+    def test_should_index_only_walked_files_when_symlinked_schema_changes(self) -> None:
+        """Test that a schema in a symlinked directory is neither indexed nor able to make the cached index stale."""
+        # arrange
+        mock_build = MagicMock(return_value=b"index-bytes")
+        with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as outside:
+            root = Path(tmpdir)
+            (root / "a.py").write_text("x = 1\n")
+            linked_schema = Path(outside) / "schema.py"
+            linked_schema.write_text("class S(BaseSchema):\n    a = Column(type=int)\n")
+            (root / "linked").symlink_to(outside, target_is_directory=True)
+            files = _collect_python_files(root)
+            cache_dir = root / ".typedframes_cache"
+
+            # act
+            with patch.dict(sys.modules, {"typedframes._rust_checker": MagicMock(build_project_index=mock_build)}):
+                _build_index(root, files, cache_dir)
+                linked_schema.write_text("class S(BaseSchema):\n    b = Column(type=int)\n")
+                _build_index(root, files, cache_dir)
+
+        # assert
+        mock_build.assert_called_once_with(str(root), [str(root / "a.py")])
+
+    def test_should_rebuild_cached_index_when_a_file_changes(self) -> None:
+        """Test that modifying a file invalidates the cached project index."""
+        # arrange
+        mock_build = MagicMock(side_effect=[b"old", b"new"])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            py_file = root / "a.py"
+            py_file.write_text("x = 1\n")
+            cache_dir = root / ".typedframes_cache"
+
+            # act
+            with patch.dict(sys.modules, {"typedframes._rust_checker": MagicMock(build_project_index=mock_build)}):
+                _build_index(root, [py_file], cache_dir)
+                py_file.write_text("x = 12\n")
+                result = _build_index(root, [py_file], cache_dir)
+
+        # assert
+        self.assertEqual(mock_build.call_count, 2)
+        self.assertEqual(result, b"new")
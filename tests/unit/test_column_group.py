@@ -124,6 +124,45 @@ class TestColumnGroup(unittest.TestCase):
         self.assertIn("user_id", str(result[0]))
         self.assertIn("email", str(result[1]))
 
+    def test_should_reuse_polars_expressions_while_names_are_unchanged(self) -> None:
+        """Test that cols() reuses expressions for the same resolved names and returns independent lists."""
+
+        # arrange
+        class TestSchema(BaseSchema):
+            user_id = Column(type=int)
+            email = Column(type=str)
+            all_fields = ColumnGroup(members=[user_id, email])
+
+        sut = TestSchema.column_groups()["all_fields"]
+        first = sut.cols()
+
+        # act
+        first.append(None)
+        second = sut.cols()
+
+        # assert
+        self.assertEqual(len(second), 2)
+        self.assertIs(second[0], first[0])
+        self.assertIs(second[1], first[1])
+
+    def test_should_rebuild_polars_expressions_when_resolved_names_change(self) -> None:
+        """Test that cols() builds new expressions when the consumed_map resolves to different columns."""
+
+        # arrange
+        class TestSchema(BaseSchema):
+            temps = ColumnSet(members=r"temp_\d+", type=float, regex=True)
+            all_sensors = ColumnGroup(members=[temps])
+
+        sut = TestSchema.column_groups()["all_sensors"]
+        sut.cols({"temps": ["temp_1"]})
+
+        # act
+        result = sut.cols({"temps": ["temp_1", "temp_2"]})
+
+        # assert
+        self.assertEqual(len(result), 2)
+        self.assertIn("temp_2", str(result[1]))
+
     def test_should_skip_unknown_member_types(self) -> None:
         """Test that get_column_names silently skips unknown member types."""
         # arrange
@@ -1,6 +1,8 @@
 """Unit tests for ColumnSet class."""
 
+import re
 import unittest
+from unittest.mock import patch
 
 from typedframes import ColumnSet
 
@@ -50,6 +52,47 @@ class TestColumnSet(unittest.TestCase):
         self.assertIn("temp_1", str(result[0]))
         self.assertIn("temp_2", str(result[1]))
 
+    def test_should_reuse_polars_expressions_across_calls(self) -> None:
+        """Test that cols() builds member expressions once and returns independent lists."""
+        # arrange
+        sut = ColumnSet(members=["temp_1", "temp_2"], type=float)
+        first = sut.cols()
+
+        # act
+        first.append(None)
+        second = sut.cols()
+
+        # assert
+        self.assertEqual(len(second), 2)
+        self.assertIs(second[0], first[0])
+
+    def test_should_serve_cached_polars_expressions_without_importing_polars(self) -> None:
+        """Test that a warm cols() cache is returned without re-running the polars import."""
+        # arrange
+        sut = ColumnSet(members=["temp_1"], type=float)
+        expected = sut.cols()
+
+        # act
+        with patch("builtins.__import__", side_effect=AssertionError("polars should not be imported")):
+            result = sut.cols()
+
+        # assert
+        self.assertIs(result[0], expected[0])
+
+    def test_should_rebuild_polars_expressions_when_members_change(self) -> None:
+        """Test that mutating members after a cols() call is reflected in the next call."""
+        # arrange
+        sut = ColumnSet(members=["temp_1"], type=float)
+        sut.cols()
+
+        # act
+        sut.members.append("temp_2")
+        result = sut.cols()
+
+        # assert
+        self.assertEqual(len(result), 2)
+        self.assertIn("temp_2", str(result[1]))
+
     def test_should_return_polars_expressions_for_matched_columns(self) -> None:
         """Test that cols() uses matched_columns when provided."""
         # arrange
@@ -114,3 +157,43 @@ class TestColumnSet(unittest.TestCase):
         # assert
         self.assertEqual(len(result), 1)
         self.assertIn("single_col", str(result[0]))
+
+    def test_should_not_carry_instance_dict(self) -> None:
+        """Test that ColumnSet instances use slots rather than a per-instance __dict__."""
+        # arrange/act
+        sut = ColumnSet(members=["a"], type=int)
+
+        # assert
+        self.assertFalse(hasattr(sut, "__dict__"))
+
+    def test_should_compile_regex_members_once(self) -> None:
+        """Test that compiled() returns the same compiled patterns on repeated calls."""
+        # arrange
+        sut = ColumnSet(members=r"temp_\d+", type=float, regex=True)
+
+        # act
+        first = sut.compiled()
+        second = sut.compiled()
+
+        # assert
+        self.assertIs(first, second)
+        self.assertTrue(first[0].match("temp_12"))
+
+    def test_should_recompile_when_members_change(self) -> None:
+        """Test that compiled() reflects members appended after definition."""
+        # arrange
+        sut = ColumnSet(members=r"temp_\d+", type=float, regex=True)
+        sut.compiled()
+
+        # act
+        sut.members.append(r"pressure_\d+")
+        result = sut.compiled()
+
+        # assert
+        self.assertEqual([p.pattern for p in result], [r"temp_\d+", r"pressure_\d+"])
+
+    def test_should_raise_for_invalid_regex_at_definition(self) -> None:
+        """Test that an invalid regex member fails when the ColumnSet is created, not on first match."""
+        # act/assert
+        with self.assertRaises(re.error):
+            ColumnSet(members="temp_(", type=float, regex=True)
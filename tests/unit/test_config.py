@@ -0,0 +1,61 @@
+"""Unit tests for the shared pyproject.toml settings reader."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from typedframes._config import index_enabled
+
+
+class TestIndexEnabled(unittest.TestCase):
+    """Unit tests for index_enabled."""
+
+    def test_should_read_build_index_from_nearest_pyproject(self) -> None:
+        """Test that build_index is read from the nearest pyproject.toml, and unusable config keeps the index on."""
+        # arrange
+        configs = {
+            "missing": None,
+            "default": "[tool.typedframes]\nenabled = true\n",
+            "disabled": "[tool.typedframes]\nbuild_index = false\n",
+            "tool_not_a_table": "tool = 1\n",
+            "typedframes_not_a_table": "[tool]\ntypedframes = 1\n",
+            "invalid": "[tool.typedframes\n",
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            roots = {}
+            for name, content in configs.items():
+                roots[name] = Path(tmpdir) / name
+                roots[name].mkdir()
+                if content is not None:
+                    (roots[name] / "pyproject.toml").write_text(content)
+
+            # act
+            results = {name: index_enabled(root) for name, root in roots.items()}
+
+        # assert
+        self.assertEqual(
+            results,
+            {
+                "missing": True,
+                "default": True,
+                "disabled": False,
+                "tool_not_a_table": True,
+                "typedframes_not_a_table": True,
+                "invalid": True,
+            },
+        )
+
+    def test_should_walk_up_to_parent_pyproject(self) -> None:
+        """Test that a directory without its own pyproject.toml uses the one in its nearest parent."""
+        # arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "pyproject.toml").write_text("[tool.typedframes]\nbuild_index = false\n")
+            nested = root / "src" / "pkg"
+            nested.mkdir(parents=True)
+
+            # act
+            result = index_enabled(nested)
+
+        # assert
+        self.assertFalse(result)
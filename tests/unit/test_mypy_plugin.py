@@ -222,3 +222,39 @@ class TestTypedFramesPluginUnit(unittest.TestCase):
         mock_build.assert_called_once()
         self.assertEqual(first, b"fake-msgpack")
         self.assertEqual(second, b"fake-msgpack")
+
+    def test_should_skip_index_when_disabled_in_pyproject(self) -> None:
+        """Test that build_index = false makes the plugin check files without building the project index."""
+        # arrange
+        mock_build = MagicMock(return_value=b"fake-msgpack")
+        new_plugin = TypedFramesPlugin(Options())
+
+        with (
+            patch("typedframes.mypy.index_enabled", return_value=False),
+            patch.dict(sys.modules, {"typedframes._rust_checker": MagicMock(build_project_index=mock_build)}),
+        ):
+            # act
+            first = new_plugin._get_index_bytes(Path("/some/project"))
+            second = new_plugin._get_index_bytes(Path("/some/project"))
+
+        # assert
+        mock_build.assert_not_called()
+        self.assertIsNone(first)
+        self.assertIsNone(second)
+
+    def test_should_bind_check_file_once_per_plugin(self) -> None:
+        """Test that check_file stays bound after the first file, without re-importing the extension."""
+        # arrange
+        mock_check_file = MagicMock(return_value=json.dumps([]))
+        new_plugin = TypedFramesPlugin(Options())
+
+        with patch.dict(sys.modules, {"typedframes._rust_checker": MagicMock(check_file=mock_check_file)}):
+            new_plugin._run_via_extension("first.py", None)
+
+        # act
+        with patch.dict(sys.modules, {"typedframes._rust_checker": None}):
+            result = new_plugin._run_via_extension("second.py", None)
+
+        # assert
+        self.assertEqual(result, [])
+        self.assertEqual(mock_check_file.call_count, 2)
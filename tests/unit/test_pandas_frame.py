@@ -35,6 +35,14 @@ class GroupedSchema(BaseSchema):
 class TestPandasFrame(unittest.TestCase):
     """Unit tests for PandasFrame."""
 
+    user_frame: PandasFrame
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build the two-row user frame shared by tests that only read from it."""
+        raw_df = pd.DataFrame({"user_id": [1, 2], "email_address": ["a@b.com", "c@d.com"]})
+        cls.user_frame = PandasFrame.from_schema(raw_df, UserSchema)
+
     def test_should_create_from_schema(self) -> None:
         """Test that from_schema creates a typed PandasFrame."""
         # arrange
@@ -50,8 +58,7 @@ class TestPandasFrame(unittest.TestCase):
     def test_should_access_column_by_descriptor(self) -> None:
         """Test that columns can be accessed by schema Column descriptor."""
         # arrange
-        raw_df = pd.DataFrame({"user_id": [1, 2], "email_address": ["a@b.com", "c@d.com"]})
-        sut = PandasFrame.from_schema(raw_df, UserSchema)
+        sut = self.user_frame
 
         # act
         result = sut[UserSchema.user_id]
@@ -63,8 +70,7 @@ class TestPandasFrame(unittest.TestCase):
     def test_should_access_aliased_column_by_descriptor(self) -> None:
         """Test that aliased columns can be accessed by schema Column descriptor."""
         # arrange
-        raw_df = pd.DataFrame({"user_id": [1, 2], "email_address": ["a@b.com", "c@d.com"]})
-        sut = PandasFrame.from_schema(raw_df, UserSchema)
+        sut = self.user_frame
 
         # act
         result = sut[UserSchema.email]
@@ -102,8 +108,7 @@ class TestPandasFrame(unittest.TestCase):
     def test_should_access_column_by_string_key(self) -> None:
         """Test that columns can be accessed by string key (standard pandas)."""
         # arrange
-        raw_df = pd.DataFrame({"user_id": [1, 2], "email_address": ["a@b.com", "c@d.com"]})
-        sut = PandasFrame.from_schema(raw_df, UserSchema)
+        sut = self.user_frame
 
         # act
         result = sut["user_id"]
@@ -115,8 +120,7 @@ class TestPandasFrame(unittest.TestCase):
     def test_should_access_columns_by_string_list(self) -> None:
         """Test that multiple columns can be accessed by list of strings."""
         # arrange
-        raw_df = pd.DataFrame({"user_id": [1, 2], "email_address": ["a@b.com", "c@d.com"]})
-        sut = PandasFrame.from_schema(raw_df, UserSchema)
+        sut = self.user_frame
 
         # act
         result = sut[["user_id", "email_address"]]
@@ -128,8 +132,7 @@ class TestPandasFrame(unittest.TestCase):
     def test_should_filter_with_boolean_series(self) -> None:
         """Test that boolean series filtering preserves PandasFrame type."""
         # arrange
-        raw_df = pd.DataFrame({"user_id": [1, 2], "email_address": ["a@b.com", "c@d.com"]})
-        sut = PandasFrame.from_schema(raw_df, UserSchema)
+        sut = self.user_frame
 
         # act
         result = sut[sut["user_id"] > 1]
@@ -141,8 +144,7 @@ class TestPandasFrame(unittest.TestCase):
     def test_should_preserve_type_after_selection(self) -> None:
         """Test that column selection preserves PandasFrame type."""
         # arrange
-        raw_df = pd.DataFrame({"user_id": [1, 2], "email_address": ["a@b.com", "c@d.com"]})
-        sut = PandasFrame.from_schema(raw_df, UserSchema)
+        sut = self.user_frame
 
         # act
         result = sut[["user_id"]]
@@ -153,8 +155,7 @@ class TestPandasFrame(unittest.TestCase):
     def test_should_convert_to_plain_pandas(self) -> None:
         """Test that to_pandas returns a plain DataFrame."""
         # arrange
-        raw_df = pd.DataFrame({"user_id": [1, 2], "email_address": ["a@b.com", "c@d.com"]})
-        sut = PandasFrame.from_schema(raw_df, UserSchema)
+        sut = self.user_frame
 
         # act
         result = sut.to_pandas()
@@ -166,8 +167,7 @@ class TestPandasFrame(unittest.TestCase):
     def test_should_fallback_to_pandas_methods(self) -> None:
         """Test that standard pandas methods work."""
         # arrange
-        raw_df = pd.DataFrame({"user_id": [1, 2], "email_address": ["a@b.com", "c@d.com"]})
-        sut = PandasFrame.from_schema(raw_df, UserSchema)
+        sut = self.user_frame
 
         # act
         shape = sut.shape
@@ -240,8 +240,7 @@ class TestPandasFrame(unittest.TestCase):
     def test_should_access_columns_after_select(self) -> None:
         """Test that schema column access works after column selection."""
         # arrange
-        raw_df = pd.DataFrame({"user_id": [1, 2], "email_address": ["a@b.com", "c@d.com"]})
-        sut = PandasFrame.from_schema(raw_df, UserSchema)
+        sut = self.user_frame
         selected = sut[["user_id", "email_address"]]
 
         # act
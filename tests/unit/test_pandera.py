@@ -1,6 +1,6 @@
 """Unit tests for to_pandera_schema."""
 
-import builtins
+import sys
 import unittest
 from typing import Any
 from unittest.mock import patch
@@ -8,7 +8,13 @@ from unittest.mock import patch
 import pandera as pa
 
 from typedframes import BaseSchema, Column, ColumnSet, MissingDependencyError
-from typedframes.pandera import to_pandera_schema
+from typedframes.pandera import _map_dtype, to_pandera_schema
+
+# Expected pandera dtypes, resolved once rather than through a throwaway pa.Column per assertion
+INT_DTYPE = pa.Column(dtype=int).dtype
+STR_DTYPE = pa.Column(dtype=str).dtype
+FLOAT_DTYPE = pa.Column(dtype=float).dtype
+BOOL_DTYPE = pa.Column(dtype=bool).dtype
 
 
 class UserSchema(BaseSchema):
@@ -77,10 +83,10 @@ class TestPanderaIntegration(unittest.TestCase):
 
         # assert
         self.assertIsInstance(result, pa.DataFrameSchema)
-        self.assertEqual(result.columns["user_id"].dtype, pa.Column(dtype=int).dtype)
-        self.assertEqual(result.columns["email"].dtype, pa.Column(dtype=str).dtype)
-        self.assertEqual(result.columns["age"].dtype, pa.Column(dtype=float).dtype)
-        self.assertEqual(result.columns["active"].dtype, pa.Column(dtype=bool).dtype)
+        self.assertEqual(result.columns["user_id"].dtype, INT_DTYPE)
+        self.assertEqual(result.columns["email"].dtype, STR_DTYPE)
+        self.assertEqual(result.columns["age"].dtype, FLOAT_DTYPE)
+        self.assertEqual(result.columns["active"].dtype, BOOL_DTYPE)
 
     def test_should_map_nullable_column(self) -> None:
         """Test that nullable=True propagates to pandera Column."""
@@ -109,7 +115,7 @@ class TestPanderaIntegration(unittest.TestCase):
         self.assertIn("temp_1", result.columns)
         self.assertIn("temp_2", result.columns)
         self.assertIn("temp_3", result.columns)
-        self.assertEqual(result.columns["temp_1"].dtype, pa.Column(dtype=float).dtype)
+        self.assertEqual(result.columns["temp_1"].dtype, FLOAT_DTYPE)
 
     def test_should_map_column_set_string_member(self) -> None:
         """Test that a ColumnSet with a single string member creates one pandera Column."""
@@ -118,7 +124,7 @@ class TestPanderaIntegration(unittest.TestCase):
 
         # assert
         self.assertIn("category", result.columns)
-        self.assertEqual(result.columns["category"].dtype, pa.Column(dtype=str).dtype)
+        self.assertEqual(result.columns["category"].dtype, STR_DTYPE)
 
     def test_should_map_column_set_regex(self) -> None:
         """Test that regex ColumnSet creates a regex pandera Column."""
@@ -153,19 +159,64 @@ class TestPanderaIntegration(unittest.TestCase):
         # assert
         self.assertIsNone(result.columns["data"].dtype)
 
-    def test_should_raise_missing_dependency_error_when_pandera_not_installed(self) -> None:
-        """Test that MissingDependencyError is raised when pandera is not installed."""
+    def test_should_reuse_converted_schema_for_same_class(self) -> None:
+        """Test that converting the same schema class twice returns the cached pandera schema."""
+        # act
+        first = to_pandera_schema(NullableSchema)
+        second = to_pandera_schema(NullableSchema)
+
+        # assert
+        self.assertIs(first, second)
+
+    def test_should_not_share_cached_schema_with_subclass(self) -> None:
+        """Test that a subclass gets its own pandera schema rather than its parent's cached one."""
+
         # arrange
-        original_import = builtins.__import__
+        class ExtendedUserSchema(UserSchema):
+            signup_date = Column(type=str)
+
+        parent = to_pandera_schema(UserSchema)
+
+        # act
+        child = to_pandera_schema(ExtendedUserSchema)
 
-        def mock_import(name: str, *args: object, **kwargs: object) -> object:
-            if name == "pandera":
-                raise ImportError
-            return original_import(name, *args, **kwargs)
+        # assert
+        self.assertIsNot(parent, child)
+        self.assertIn("signup_date", child.columns)
+        self.assertNotIn("signup_date", parent.columns)
 
+    def test_should_resolve_engine_dtype_once_per_python_type(self) -> None:
+        """Test that _map_dtype hands pandera a pre-resolved engine dtype and reuses it."""
+        # act
+        first = _map_dtype(int)
+        second = _map_dtype(int)
+
+        # assert
+        self.assertIs(first, second)
+        self.assertEqual(pa.Column(dtype=first).dtype, INT_DTYPE)
+
+    def test_should_build_one_column_per_repeated_pattern_with_last_definition_winning(self) -> None:
+        """Test that a pattern declared in two ColumnSets yields one pandera Column from the later definition."""
+
+        # arrange
+        class RepeatedPatternSchema(BaseSchema):
+            raw_scores = ColumnSet(members=r"score_\d+", type=int, regex=True)
+            scores = ColumnSet(members=r"score_\d+", type=float, regex=True)
+
+        # act
+        with patch("pandera.Column", wraps=pa.Column) as column:
+            result = to_pandera_schema(RepeatedPatternSchema)
+
+        # assert
+        column.assert_called_once()
+        self.assertEqual(list(result.columns), [r"score_\d+"])
+        self.assertEqual(result.columns[r"score_\d+"].dtype, FLOAT_DTYPE)
+
+    def test_should_raise_missing_dependency_error_when_pandera_not_installed(self) -> None:
+        """Test that MissingDependencyError is raised when pandera is not installed."""
         # act/assert
         with (
-            patch("builtins.__import__", side_effect=mock_import),
+            patch.dict(sys.modules, {"pandera": None}),
             self.assertRaises(MissingDependencyError) as ctx,
         ):
             to_pandera_schema(UserSchema)